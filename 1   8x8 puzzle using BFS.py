@@ -1,22 +1,29 @@
 from collections import deque
+#the distance table is written once and memory-mapped on later runs
+import mmap
+import os
 N = 3
-class PuzzleState:
-    def __init__(self, board, x, y, depth, path):
-          # constructor
-        self.board = board
-        self.x = x
-        self.y = y
-        self.depth = depth
-        # list of moves
-        self.path = path  
  # directions
 row = [0, 0, -1, 1]
 col = [-1, 1, 0, 0]
 moves = ['left', 'right', 'up', 'down']
 
+# ---------------- Packed state encoding ----------------
+#a whole board is one int: every tile takes 4 bits (a nibble),cell i = x*N+y sits at bits 4*i..4*i+3
+#the blank's cell index is kept in the nibble right above the board, so we never search for the 0 again
+#3x3 -> 9 nibbles + 1 for the blank = 40 bits,fits easily in a 64 bit int
+#bigger boards (N=4,5) just work with N changed,5x5 needs 5 bits per tile
+CELLS = N * N
+BITS = max(4, (CELLS - 1).bit_length())
+TILE_MASK = (1 << BITS) - 1
+BLANK_SHIFT = BITS * CELLS
+BOARD_MASK = (1 << BLANK_SHIFT) - 1
+
+#1..N*N-1 in order, blank in the last cell
+GOAL = [[(x * N + y + 1) % CELLS for y in range(N)] for x in range(N)]
+
 def isGoalState(board):
-    goal = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
-    return board == goal
+    return board == GOAL
 
 def isValidState(x, y):
     return 0 <= x < N and 0 <= y < N
@@ -36,51 +43,238 @@ def issolvable(board):
                 inversions += 1
 
     # solvable if inversions are even else odd.
-    return inversions % 2 == 0
+    if N % 2 == 1:
+        return inversions % 2 == 0
+    #even width: the blank's row counted from the bottom flips the rule
+    blankRowFromBottom = N - next(x for x in range(N) if 0 in board[x])
+    return (inversions + blankRowFromBottom) % 2 == 1
+
+def encodeBoard(board):
+    #2d board -> packed int
+    code = 0
+    for x in range(N):
+        for y in range(N):
+            cell = x * N + y
+            code |= board[x][y] << (BITS * cell)
+            if board[x][y] == 0:
+                code |= cell << BLANK_SHIFT
+    return code
+
+def decodeBoard(code):
+    #packed int -> 2d board (only needed for printing/checking)
+    return [[(code >> (BITS * (x * N + y))) & TILE_MASK for y in range(N)] for x in range(N)]
+
+def buildMoveTable():
+    #for every blank cell: (move index, shift of the tile we swap with, int delta for the blank nibble)
+    #moving the blank from b to t = tile goes t->b,so the new code is
+    #code - (tile << shift_t) + (tile << shift_b) + ((t - b) << BLANK_SHIFT)
+    table = []
+    for blank in range(CELLS):
+        x, y = divmod(blank, N)
+        options = []
+        for i in range(4):
+            newx, newy = x + row[i], y + col[i]
+            if isValidState(newx, newy):
+                target = newx * N + newy
+                options.append((i, BITS * target, BITS * blank, (target - blank) << BLANK_SHIFT))
+        table.append(tuple(options))
+    return table
+
+#precomputed once,indexed by blank cell
+MOVE_TABLE = buildMoveTable()
+GOAL_CODE = encodeBoard(GOAL)
 
+def expand(code):
+    #yields every child of a packed state (just int arithmetic, no board copies)
+    for i, tshift, bshift, bdelta in MOVE_TABLE[code >> BLANK_SHIFT]:
+        tile = (code >> tshift) & TILE_MASK
+        yield code - (tile << tshift) + (tile << bshift) + bdelta
 
-def solvePuzzleBfs(start, x, y):  
-    q = deque()
-    visited = set()
-    q.append(PuzzleState(start, x, y, 0, []))
-    # 2d tuple thing
-    visited.add(tuple(map(tuple, start)))
+def moveName(parent, child):
+    #the move is recovered from where the blank went, so the parent dict only needs to store ints
+    step = (child >> BLANK_SHIFT) - (parent >> BLANK_SHIFT)
+    if step == -1:
+        return 'left'
+    if step == 1:
+        return 'right'
+    return 'up' if step < 0 else 'down'
 
+def rebuildPath(parent, code):
+    #walk the parent pointers back to the start, then flip it
+    path = []
+    while parent[code] is not None:
+        path.append(moveName(parent[code], code))
+        code = parent[code]
+    path.reverse()
+    return path
+
+def bfsPacked(startCode, goalCode=GOAL_CODE):
+    #frontier & visited hold plain ints, parent dict doubles as the visited set
+    parent = {startCode: None}
+    if startCode == goalCode:
+        return []
+    q = deque([startCode])
     while q:
-         # must add braces after popleft
         curr = q.popleft()
-        # after evry iteration 1st check whether it has reached the goal
-        if isGoalState(curr.board):
-             # withut f str it wont evaluate depth variable
-            print(f'\nGoal Reached at depth: {curr.depth}')
-            print(f'Solution path: {curr.path}')
-            print(f'Number of steps: {len(curr.path)}')
-            return
+        for child in expand(curr):
+            if child not in parent:
+                parent[child] = curr
+                #goal test on generation,saves a whole layer of expansions
+                if child == goalCode:
+                    return rebuildPath(parent, child)
+                q.append(child)
+    return None
 
-        for i in range(4):
-            newx = curr.x + row[i]
-            newy = curr.y + col[i]
+def bfsBidirectional(startCode, goalCode=GOAL_CODE):
+    #grow one layer from the start side, then one from the goal side, always picking the smaller frontier
+    #when a child is already in the other side's dict the two searches met -> splice both halves
+    #expanding whole layers means the first meeting is already a shortest path
+    if startCode == goalCode:
+        return []
+    parentF = {startCode: None}
+    parentB = {goalCode: None}
+    frontF, frontB = [startCode], [goalCode]
+    while frontF and frontB:
+        forward = len(frontF) <= len(frontB)
+        front, mine, other = (frontF, parentF, parentB) if forward else (frontB, parentB, parentF)
+        nextFront = []
+        for curr in front:
+            for child in expand(curr):
+                if child in mine:
+                    continue
+                mine[child] = curr
+                if child in other:
+                    return splicePath(parentF, parentB, child)
+                nextFront.append(child)
+        if forward:
+            frontF = nextFront
+        else:
+            frontB = nextFront
+    return None
 
-            if isValidState(newx, newy):
-                 #    individually adds the each row
-                newboard = [r[:] for r in curr.board]
-                  # swap 0 with the target cell
-                newboard[curr.x][curr.y], newboard[newx][newy] = newboard[newx][newy], newboard[curr.x][curr.y]
-                if tuple(map(tuple, newboard)) not in visited:
-                    visited.add(tuple(map(tuple, newboard)))
-                    # Append current move to path
-                    new_path = curr.path + [moves[i]]
-                    q.append(PuzzleState(newboard, newx, newy, curr.depth + 1, new_path))
-
-    print(' No solution found (BFS reached depth limit)')
-
-if __name__ == '__main__':  
+def splicePath(parentF, parentB, meet):
+    #start -> meet comes straight from the forward parents
+    path = rebuildPath(parentF, meet)
+    #meet -> goal: the goal side stored "who generated me", so every step is a move we make in reverse
+    code = meet
+    while parentB[code] is not None:
+        path.append(moveName(code, parentB[code]))
+        code = parentB[code]
+    return path
+
+def exhaustiveBfs(start):
+    #visits every reachable state from start,returns {code: depth}
+    #from the 3x3 goal this is all 9!/2 = 181440 states
+    code = encodeBoard(start)
+    depth = {code: 0}
+    layer = [code]
+    d = 0
+    while layer:
+        d += 1
+        nextLayer = []
+        for curr in layer:
+            for child in expand(curr):
+                if child not in depth:
+                    depth[child] = d
+                    nextLayer.append(child)
+        layer = nextLayer
+    return depth
+
+# ---------------- Precomputed distance table (3x3 only) ----------------
+#every reachable 3x3 board gets its exact distance to the goal,one byte each
+#a board = blank cell + the order of the other 8 tiles; the tiles are ranked by their Lehmer code (0..8!-1)
+#swapping the last two tiles only flips the lowest digit and the inversion parity,
+#so rank and rank^1 are never both solvable -> rank // 2 is enough
+#-> 9 blank cells * 8!/2 = 181440 reachable boards in 181440 bytes
+DISTANCE_FILE = '8puzzle_distances.bin'
+FACTORIALS = [1]
+for i in range(1, CELLS):
+    FACTORIALS.append(FACTORIALS[-1] * i)
+HALF_PERMS = FACTORIALS[-1] // 2
+distanceTable = None
+
+def rankCode(code):
+    #table index of a packed code (see above)
+    tiles = [(code >> (BITS * i)) & TILE_MASK for i in range(CELLS)]
+    tiles.remove(0)
+    rank = 0
+    for i in range(CELLS - 2):
+        smaller = 0
+        for t in tiles[i + 1:]:
+            if t < tiles[i]:
+                smaller += 1
+        rank += smaller * FACTORIALS[CELLS - 2 - i]
+    return (code >> BLANK_SHIFT) * HALF_PERMS + rank // 2
+
+def buildDistanceTable(path=DISTANCE_FILE):
+    #one full BFS from the goal,then every distance lands at its rank
+    table = bytearray(CELLS * HALF_PERMS)
+    for code, depth in exhaustiveBfs(GOAL).items():
+        table[rankCode(code)] = depth
+    #written next to it and renamed into place: an interrupted build never leaves a short table behind,
+    #and a process starting at the same time sees either no file or the whole one
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(table)
+    os.replace(tmp, path)
+
+def loadDistanceTable(path=DISTANCE_FILE):
+    #build on the first run,afterwards just map the file (the OS shares the pages between processes)
+    #a file of the wrong size (left by an older version or a crash) is rebuilt
+    if not os.path.exists(path) or os.path.getsize(path) != CELLS * HALF_PERMS:
+        buildDistanceTable(path)
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def lookup_solution(board):
+    #optimal move list without any search: keep stepping to a neighbour that is one closer to the goal
+    global distanceTable
+    if N != 3:
+        raise ValueError('the distance table only exists for the 3x3 puzzle')
+    if not issolvable(board):
+        return None
+    if distanceTable is None:
+        distanceTable = loadDistanceTable()
+    code = encodeBoard(board)
+    depth = distanceTable[rankCode(code)]
+    path = []
+    while depth > 0:
+        for child in expand(code):
+            if distanceTable[rankCode(child)] == depth - 1:
+                path.append(moveName(code, child))
+                code = child
+                depth -= 1
+                break
+    return path
+
+
+def solvePuzzleBfs(start, x, y, bidirectional=False):
+    #odd inversion count -> the goal is unreachable,no point searching at all
+    if not issolvable(start):
+        print(' No solution found (puzzle is not solvable)')
+        return None
+    # the blank's position comes from (x,y) like before
+    code = encodeBoard(start) & BOARD_MASK | ((x * N + y) << BLANK_SHIFT)
+    path = bfsBidirectional(code) if bidirectional else bfsPacked(code)
+    if path is None:
+        print(' No solution found (BFS reached depth limit)')
+        return None
+     # withut f str it wont evaluate depth variable
+    print(f'\nGoal Reached at depth: {len(path)}')
+    print(f'Solution path: {path}')
+    print(f'Number of steps: {len(path)}')
+    return path
+
+if __name__ == '__main__':
     start = [[1, 2, 3], [4, 0, 5], [6, 7, 8]]
-    goal = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+    goal = GOAL
     x, y = 1, 1
     print('Initial State:')
     printBoard(start)
     print('\nGoal State:')
     printBoard(goal)
     solvePuzzleBfs(start, x, y)
-    issolvable(start)
+    print('\nBidirectional BFS:')
+    solvePuzzleBfs(start, x, y, bidirectional=True)
+    print('\nTable lookup:')
+    print(f'Solution path: {lookup_solution(start)}')
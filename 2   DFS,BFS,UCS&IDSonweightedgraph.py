@@ -2,14 +2,29 @@
 import networkx as nx
 #to pick random nodes&generate random wts 
 import random
+#vectorized random graph generation
+import numpy as np
 #to get execution times of algos
 import time
-#not used
-import pandas as pd
+#benchmark trials run in a process pool,results go to csv/json
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import statistics
+import csv
+import json
 #used in ucs
 from queue import PriorityQueue
+#plain binary heap for the faster ucs (no locks)
+import heapq
 #used in bfs for efficient algo
 from collections import deque
+#compact typed arrays for the CSR graph
+from array import array
+#binary search inside a node's sorted neighbour row
+from bisect import bisect_left
+#landmark distance tables are cached on disk,crc32 tells us if they belong to this graph
+import os
+import zlib
 
 # Ensure&generate the connected graph
 def generate_connected_graph(n, edge_prob=0.01):
@@ -24,6 +39,151 @@ def generate_connected_graph(n, edge_prob=0.01):
                 G.edges[u, v]['weight'] = random.randint(1, 10)
             return G
 
+# Connected by construction: a random spanning tree + random extra edges,no generate-and-reject loop.
+#Extra edges use geometric skips: the gap to the next chosen pair out of all n(n-1)/2 is geometric(p),
+#so we only touch the ~p*n^2/2 edges we keep instead of flipping a coin for every pair.
+#Weights are drawn in one numpy call and the result goes straight into a CSRGraph.
+def generate_connected_csr(n, edge_prob=0.01, weight_range=(1, 10), seed=None):
+    rng = np.random.default_rng(seed)
+    #random tree: in a random order,every node hooks onto a random node that came before it
+    order = rng.permutation(n)
+    earlier = (rng.random(n - 1) * np.arange(1, n)).astype(np.int64)
+    tree_u, tree_v = order[1:], order[earlier]
+    total = n * (n - 1) // 2
+    idx = np.empty(0, dtype=np.int64)
+    if edge_prob > 0 and total > 0:
+        #draw a few more gaps than expected, top up in the rare case it wasn't enough
+        batch = int(total * edge_prob + 5 * (total * edge_prob) ** 0.5) + 16
+        last = -1
+        chunks = []
+        while last < total:
+            gaps = rng.geometric(edge_prob, size=batch)
+            chunk = last + np.cumsum(gaps)
+            chunks.append(chunk)
+            last = chunk[-1]
+        idx = np.concatenate(chunks)
+        idx = idx[idx < total]
+    #pair index -> (u, v) with u < v: v = row of the lower triangle,u = position in that row
+    v = np.floor((1 + np.sqrt(1 + 8 * idx.astype(np.float64))) / 2).astype(np.int64)
+    #float rounding can be off by one for huge n
+    v -= (v * (v - 1) // 2 > idx)
+    v += ((v + 1) * v // 2 <= idx)
+    u = idx - v * (v - 1) // 2
+    #skip extra edges the tree already has
+    tree_keys = np.minimum(tree_u, tree_v) * n + np.maximum(tree_u, tree_v)
+    keep = ~np.isin(u * n + v, tree_keys)
+    us = np.concatenate([tree_u, u[keep]])
+    vs = np.concatenate([tree_v, v[keep]])
+    weights = rng.integers(weight_range[0], weight_range[1] + 1, size=len(us))
+    return CSRGraph.from_arrays(n, us, vs, weights)
+
+# ---------------- CSR graph backend ----------------
+#compressed sparse row: the neighbours of v are targets[offsets[v]:offsets[v+1]] (sorted),
+#their edge weights sit at the same positions in weights.
+#3 flat typed arrays instead of networkx's dict-of-dicts -> a few bytes per edge,scales to millions of nodes.
+#It has neighbors() and edges[u, v]['weight'] like a networkx graph so bfs/dfs/ucs/ids run on it as is.
+class CSRGraph:
+    def __init__(self, offsets, targets, weights):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.edges = _CSREdgeView(self)
+
+    def number_of_nodes(self):
+        return len(self.offsets) - 1
+
+    def number_of_edges(self):
+        #every undirected edge is stored in both rows
+        return len(self.targets) // 2
+
+    def neighbors(self, v):
+        return self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+    #(neighbour, weight) pairs straight from the arrays
+    def weighted_neighbors(self, v):
+        lo, hi = self.offsets[v], self.offsets[v + 1]
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+    def weight(self, u, v):
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        i = bisect_left(self.targets, v, lo, hi)
+        if i == hi or self.targets[i] != v:
+            raise KeyError((u, v))
+        return self.weights[i]
+
+    #builds the arrays from an undirected edge list [(u, v, w), ...] on nodes 0..n-1
+    @classmethod
+    def from_edges(cls, n, edges):
+        degree = [0] * (n + 1)
+        for u, v, w in edges:
+            degree[u + 1] += 1
+            degree[v + 1] += 1
+        #prefix sum of degrees = where each row starts
+        offsets = array('q', degree)
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        fill = array('q', offsets[:-1])
+        rows = [None] * len(edges) * 2
+        for u, v, w in edges:
+            rows[fill[u]] = (v, w)
+            fill[u] += 1
+            rows[fill[v]] = (u, w)
+            fill[v] += 1
+        targets = array('q', bytes(8 * len(rows)))
+        weights = array('d', bytes(8 * len(rows)))
+        for v in range(n):
+            lo, hi = offsets[v], offsets[v + 1]
+            #sort every row so weight() can binary search it
+            for i, (t, w) in enumerate(sorted(rows[lo:hi]), lo):
+                targets[i] = t
+                weights[i] = w
+        return cls(offsets, targets, weights)
+
+    #same thing vectorized,from numpy arrays of edge endpoints and weights
+    @classmethod
+    def from_arrays(cls, n, us, vs, ws):
+        src = np.concatenate([us, vs]).astype(np.int64)
+        dst = np.concatenate([vs, us]).astype(np.int64)
+        w = np.concatenate([ws, ws]).astype(np.float64)
+        #sort by row,then by target inside the row
+        order = np.lexsort((dst, src))
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=offsets[1:])
+        return cls(array('q', offsets.tobytes()), array('q', dst[order].tobytes()), array('d', w[order].tobytes()))
+
+    @classmethod
+    def from_networkx(cls, G):
+        edges = [(u, v, d.get('weight', 1)) for u, v, d in G.edges(data=True)]
+        return cls.from_edges(G.number_of_nodes(), edges)
+
+    #edge file: first line = number of nodes, then one "u v weight" line per undirected edge
+    @classmethod
+    def from_edge_file(cls, path):
+        with open(path) as f:
+            n = int(f.readline())
+            edges = []
+            for line in f:
+                parts = line.split()
+                if parts:
+                    edges.append((int(parts[0]), int(parts[1]), float(parts[2]) if len(parts) > 2 else 1))
+        return cls.from_edges(n, edges)
+
+    def to_edge_file(self, path):
+        with open(path, 'w') as f:
+            f.write(f"{self.number_of_nodes()}\n")
+            for u in range(self.number_of_nodes()):
+                for i in range(self.offsets[u], self.offsets[u + 1]):
+                    if u < self.targets[i]:
+                        f.write(f"{u} {self.targets[i]} {self.weights[i]:g}\n")
+
+#so graph.edges[u, v]['weight'] keeps working on a CSRGraph
+class _CSREdgeView:
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __getitem__(self, uv):
+        return {'weight': self.graph.weight(*uv)}
+
 # BFS
 def bfs(graph, start, goal):
     visited, queue = set(), deque([(start, [start])])
@@ -72,6 +232,277 @@ def ucs(graph, start, goal):
                 pq.put((cost + edge_cost, neighbor, path + [neighbor]))
     return None, nodes_generated, float('inf')
 
+# ---------------- Predecessor-array searches ----------------
+#Same searches without carrying a path in every frontier entry:
+#pred[v] = the node we reached v from,the path is rebuilt only once the goal is found.
+#nodes_generated is counted so it matches bfs/dfs/ucs above exactly.
+def build_path(pred, start, goal):
+    path = [goal]
+    while path[-1] != start:
+        path.append(pred[path[-1]])
+    path.reverse()
+    return path
+
+def fast_bfs(graph, start, goal):
+    nodes_generated = 1
+    if start == goal:
+        return [start], nodes_generated
+    pred = array('q', [-1]) * graph.number_of_nodes()
+    pred[start] = start
+    queue = deque([start])
+    while queue:
+        vertex = queue.popleft()
+        for neighbor in graph.neighbors(vertex):
+            #the old bfs queued every neighbour and counted it when popped,
+            #so every neighbour looked at here is one generated node
+            nodes_generated += 1
+            #visited on push: a node is queued at most once
+            if pred[neighbor] == -1:
+                pred[neighbor] = vertex
+                if neighbor == goal:
+                    return build_path(pred, start, goal), nodes_generated
+                queue.append(neighbor)
+    return None, nodes_generated
+
+def fast_dfs(graph, start, goal):
+    pred = array('q', [-1]) * graph.number_of_nodes()
+    #stack of (node, node we came from) kept as two flat lists
+    stack, parents = [start], [start]
+    nodes_generated = 0
+    while stack:
+        vertex, parent = stack.pop(), parents.pop()
+        nodes_generated += 1
+        if vertex == goal:
+            pred[vertex] = parent
+            return build_path(pred, start, goal), nodes_generated
+        if pred[vertex] == -1:
+            pred[vertex] = parent
+            for neighbor in graph.neighbors(vertex):
+                stack.append(neighbor)
+                parents.append(vertex)
+    return None, nodes_generated
+
+#(neighbour, weight) pairs: straight from the arrays on a CSRGraph,from the edge dicts on networkx
+def weighted_neighbors(graph, v):
+    if isinstance(graph, CSRGraph):
+        return graph.weighted_neighbors(v)
+    return ((u, d['weight']) for u, d in graph.adj[v].items())
+
+def fast_ucs(graph, start, goal):
+    n = graph.number_of_nodes()
+    dist = array('d', [float('inf')]) * n
+    pred = array('q', [-1]) * n
+    done = bytearray(n)
+    dist[start] = 0
+    pred[start] = start
+    #heapq instead of queue.PriorityQueue,no lock per push/pop
+    heap = [(0, start)]
+    nodes_generated = 0
+    #entries the old ucs would have queued but we don't (no improvement),
+    #kept only so nodes_generated can be reported the same way
+    skipped_cost, skipped_node = array('d'), array('q')
+    while heap:
+        cost, vertex = heapq.heappop(heap)
+        nodes_generated += 1
+        #stale entry,vertex was already settled with a smaller cost
+        if done[vertex]:
+            continue
+        if vertex == goal:
+            #the old queue would also have popped every skipped entry that sorts before the goal
+            for c, v in zip(skipped_cost, skipped_node):
+                if c < cost or (c == cost and v < goal):
+                    nodes_generated += 1
+            return build_path(pred, start, goal), nodes_generated, cost
+        done[vertex] = 1
+        for neighbor, w in weighted_neighbors(graph, vertex):
+            new_cost = cost + w
+            if not done[neighbor] and new_cost < dist[neighbor]:
+                dist[neighbor] = new_cost
+                pred[neighbor] = vertex
+                heapq.heappush(heap, (new_cost, neighbor))
+            else:
+                skipped_cost.append(new_cost)
+                skipped_node.append(neighbor)
+    return None, nodes_generated + len(skipped_cost), float('inf')
+
+# ---------------- Point-to-point queries: bidirectional Dijkstra & ALT ----------------
+#For many source/destination queries on the same graph.
+#Both return (path, nodes settled, cost) like ucs.
+#full single-source dijkstra,returns the distance of every node (used for landmarks)
+def dijkstra_all(graph, source):
+    dist = array('d', [float('inf')]) * graph.number_of_nodes()
+    dist[source] = 0
+    heap = [(0, source)]
+    while heap:
+        cost, vertex = heapq.heappop(heap)
+        if cost > dist[vertex]:
+            continue
+        for neighbor, w in weighted_neighbors(graph, vertex):
+            if cost + w < dist[neighbor]:
+                dist[neighbor] = cost + w
+                heapq.heappush(heap, (cost + w, neighbor))
+    return dist
+
+#Dijkstra from both ends at once,always growing the side with the smaller top key.
+#mu = best s-t path seen where the two searches touch; stop once the two top keys add up to mu.
+def bidirectional_dijkstra(graph, start, goal):
+    if start == goal:
+        return [start], 1, 0
+    dist = [{start: 0}, {goal: 0}]
+    pred = [{start: start}, {goal: goal}]
+    done = [set(), set()]
+    heaps = [[(0, start)], [(0, goal)]]
+    mu, meet = float('inf'), None
+    nodes = 0
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= mu:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        cost, vertex = heapq.heappop(heaps[side])
+        if vertex in done[side]:
+            continue
+        done[side].add(vertex)
+        nodes += 1
+        mine, other = dist[side], dist[1 - side]
+        for neighbor, w in weighted_neighbors(graph, vertex):
+            new_cost = cost + w
+            if new_cost < mine.get(neighbor, float('inf')):
+                mine[neighbor] = new_cost
+                pred[side][neighbor] = vertex
+                heapq.heappush(heaps[side], (new_cost, neighbor))
+            #both searches reached neighbor -> candidate path
+            if neighbor in other and mine[neighbor] + other[neighbor] < mu:
+                mu, meet = mine[neighbor] + other[neighbor], neighbor
+    if meet is None:
+        return None, nodes, float('inf')
+    #start -> meet from the forward side,meet -> goal from the backward side
+    path = [meet]
+    while path[-1] != start:
+        path.append(pred[0][path[-1]])
+    path.reverse()
+    while path[-1] != goal:
+        path.append(pred[1][path[-1]])
+    return path, nodes, mu
+
+def graph_fingerprint(graph):
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_networkx(graph)
+    crc = zlib.crc32(graph.offsets.tobytes())
+    crc = zlib.crc32(graph.targets.tobytes(), crc)
+    return zlib.crc32(graph.weights.tobytes(), crc)
+
+#ALT = A* + Landmarks + Triangle inequality:
+#d(v,t) >= |d(L,t) - d(L,v)| for every landmark L,the max over landmarks is an admissible heuristic.
+class LandmarkIndex:
+    def __init__(self, landmarks, tables, fingerprint):
+        self.landmarks = landmarks
+        #tables[i][v] = distance from landmarks[i] to v
+        self.tables = tables
+        self.fingerprint = fingerprint
+
+    #farthest-point selection: every new landmark is the node farthest from the ones we already have
+    @classmethod
+    def build(cls, graph, k=8, seed=0):
+        n = graph.number_of_nodes()
+        first = random.Random(seed).randrange(n)
+        #farthest node from a random one makes a better first landmark than the random one itself
+        dist = dijkstra_all(graph, first)
+        landmarks, tables = [], []
+        closest = array('d', [float('inf')]) * n
+        while len(landmarks) < min(k, n):
+            if not landmarks:
+                nxt = max(range(n), key=dist.__getitem__)
+            else:
+                nxt = max(range(n), key=closest.__getitem__)
+            landmarks.append(nxt)
+            table = dijkstra_all(graph, nxt)
+            tables.append(table)
+            for v in range(n):
+                if table[v] < closest[v]:
+                    closest[v] = table[v]
+        return cls(landmarks, tables, graph_fingerprint(graph))
+
+    #file: "fingerprint n k" line, landmark ids line, then k*n raw doubles
+    #written to a temporary file and renamed into place,so a crash or a second process never sees half of it
+    def save(self, path):
+        n = len(self.tables[0])
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(f"{self.fingerprint} {n} {len(self.landmarks)}\n".encode())
+            f.write((" ".join(map(str, self.landmarks)) + "\n").encode())
+            for table in self.tables:
+                f.write(table.tobytes())
+        os.replace(tmp, path)
+
+    #ValueError if the file is empty,cut short or has extra bytes
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            fingerprint, n, k = map(int, f.readline().split())
+            landmarks = [int(x) for x in f.readline().split()]
+            if len(landmarks) != k:
+                raise ValueError(f"{path}: expected {k} landmarks")
+            tables = []
+            for _ in range(k):
+                table = array('d')
+                try:
+                    table.fromfile(f, n)
+                except EOFError:
+                    raise ValueError(f"{path}: distance tables are cut short")
+                tables.append(table)
+            if f.read(1):
+                raise ValueError(f"{path}: trailing data")
+        return cls(landmarks, tables, fingerprint)
+
+    #reuse the cached tables only if they were built for this exact graph
+    @classmethod
+    def load_or_build(cls, path, graph, k=8, seed=0):
+        if os.path.exists(path):
+            try:
+                index = cls.load(path)
+                if index.fingerprint == graph_fingerprint(graph) and len(index.landmarks) == k:
+                    return index
+            #damaged file (interrupted write): build it again
+            except ValueError:
+                pass
+        index = cls.build(graph, k, seed)
+        index.save(path)
+        return index
+
+    def lower_bound(self, v, goal):
+        best = 0
+        for table in self.tables:
+            diff = abs(table[goal] - table[v])
+            if diff > best:
+                best = diff
+        return best
+
+def alt_astar(graph, start, goal, index):
+    dist = {start: 0}
+    pred = {start: start}
+    done = set()
+    heap = [(index.lower_bound(start, goal), 0, start)]
+    nodes = 0
+    while heap:
+        f, cost, vertex = heapq.heappop(heap)
+        if vertex in done:
+            continue
+        done.add(vertex)
+        nodes += 1
+        if vertex == goal:
+            path = [goal]
+            while path[-1] != start:
+                path.append(pred[path[-1]])
+            path.reverse()
+            return path, nodes, cost
+        for neighbor, w in weighted_neighbors(graph, vertex):
+            new_cost = cost + w
+            if neighbor not in done and new_cost < dist.get(neighbor, float('inf')):
+                dist[neighbor] = new_cost
+                pred[neighbor] = vertex
+                heapq.heappush(heap, (new_cost + index.lower_bound(neighbor, goal), new_cost, neighbor))
+    return None, nodes, float('inf')
+
 # IDS
 def dls(graph, current, goal, limit, path, visited, nodes_generated):
     nodes_generated[0] += 1
@@ -98,64 +529,192 @@ def ids(graph, start, goal):
             return result, nodes_generated[0]
         depth += 1
 
+# ---------------- Iterative IDS ----------------
+#Same depth-limited search as dls/ids but with an explicit stack: no python frames,no recursion limit.
+#One path list is shared by the whole search (append on the way down,pop on the way back)
+#and on_path replaces the visited set; nodes_generated counts exactly what dls counts.
+def dls_iterative(graph, start, goal, limit, on_path):
+    nodes_generated = 1
+    if start == goal:
+        return [start], nodes_generated, False
+    if limit <= 0:
+        return None, nodes_generated, True
+    #cutoff = some node was left unexpanded because of the limit (a deeper search might still succeed)
+    cutoff = False
+    path = [start]
+    on_path[start] = 1
+    #one neighbour iterator per node on the path
+    stack = [iter(graph.neighbors(start))]
+    while stack:
+        neighbor = next(stack[-1], -1)
+        if neighbor == -1:
+            #all neighbours done -> step back
+            stack.pop()
+            on_path[path.pop()] = 0
+            continue
+        if on_path[neighbor]:
+            continue
+        nodes_generated += 1
+        if neighbor == goal:
+            path.append(neighbor)
+            for v in path:
+                on_path[v] = 0
+            return path, nodes_generated, cutoff
+        #the neighbour sits at depth len(path),it still has limit - len(path) levels below it
+        if len(path) < limit:
+            path.append(neighbor)
+            on_path[neighbor] = 1
+            stack.append(iter(graph.neighbors(neighbor)))
+        else:
+            cutoff = True
+    return None, nodes_generated, cutoff
+
+#hybrid=True: while the set of nodes reached at the last depth is small (<= max_frontier),
+#the next depth is found by expanding just that set one step (IDS-BFS hybrid)
+#instead of redoing the whole DFS down to it. In an undirected graph the neighbours of layer d
+#are in layers d-1, d, d+1, so 3 layers are all we ever keep.
+#Once the goal shows up we know its depth and a single depth-limited search at that depth gives the path.
+def ids_iterative(graph, start, goal, hybrid=False, max_frontier=100000):
+    on_path = bytearray(graph.number_of_nodes())
+    nodes_generated = 0
+    frontier, previous = ({start}, set()) if hybrid else (None, None)
+    depth = 0
+    while True:
+        if frontier is not None and depth > 0:
+            layer = set()
+            for u in frontier:
+                for v in graph.neighbors(u):
+                    nodes_generated += 1
+                    if v not in frontier and v not in previous:
+                        layer.add(v)
+            if not layer:
+                return None, nodes_generated
+            if goal in layer:
+                result, count, cutoff = dls_iterative(graph, start, goal, depth, on_path)
+                return result, nodes_generated + count
+            previous, frontier = frontier, layer
+            if len(layer) > max_frontier:
+                #too big to hold,plain iterative deepening from the next depth on
+                frontier = None
+            depth += 1
+            continue
+        result, count, cutoff = dls_iterative(graph, start, goal, depth, on_path)
+        nodes_generated += count
+        if result:
+            return result, nodes_generated
+        #nothing was cut off by the limit -> going deeper can't help
+        if not cutoff:
+            return None, nodes_generated
+        depth += 1
+
+# ---------------- Benchmark harness ----------------
+#Every trial = one random source/destination pair run through every algorithm.
+#Trials are spread over a process pool; the graph is handed to each worker once (inherited on fork),
+#and each trial only ships two ints in and a few numbers out.
+ALGORITHMS = ["BFS", "DFS", "UCS", "IDS", "BiDijkstra", "ALT"]
+worker_graph = None
+worker_landmarks = None
+
+def init_worker(graph, landmarks):
+    global worker_graph, worker_landmarks
+    worker_graph = graph
+    worker_landmarks = landmarks
+
+def run_search(name, graph, landmarks, src, dest):
+    if name == "BFS":
+        path, nodes = fast_bfs(graph, src, dest)
+        return nodes, None
+    if name == "DFS":
+        path, nodes = fast_dfs(graph, src, dest)
+        return nodes, None
+    if name == "IDS":
+        path, nodes = ids_iterative(graph, src, dest)
+        return nodes, None
+    if name == "UCS":
+        path, nodes, cost = fast_ucs(graph, src, dest)
+    elif name == "BiDijkstra":
+        path, nodes, cost = bidirectional_dijkstra(graph, src, dest)
+    else:
+        path, nodes, cost = alt_astar(graph, src, dest, landmarks)
+    return nodes, cost
+
+def run_trial(trial):
+    trial_id, src, dest = trial
+    rows = []
+    for name in ALGORITHMS:
+        #perf_counter_ns: monotonic,highest resolution clock there is
+        start_time = time.perf_counter_ns()
+        nodes, cost = run_search(name, worker_graph, worker_landmarks, src, dest)
+        elapsed = time.perf_counter_ns() - start_time
+        rows.append({"trial": trial_id, "algorithm": name, "src": src, "dest": dest,
+                     "time_ns": elapsed, "nodes": nodes, "cost": cost})
+    return rows
+
+#nearest-rank percentile
+def percentile(values, q):
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+def summarize(rows):
+    summary = []
+    for name in ALGORITHMS:
+        mine = [r for r in rows if r["algorithm"] == name]
+        times = [r["time_ns"] / 1e6 for r in mine]
+        costs = [r["cost"] for r in mine if r["cost"] is not None]
+        summary.append({
+            "algorithm": name,
+            "trials": len(mine),
+            "mean_ms": statistics.fmean(times),
+            "median_ms": statistics.median(times),
+            "p95_ms": percentile(times, 95),
+            "mean_nodes": statistics.fmean(r["nodes"] for r in mine),
+            "mean_cost": statistics.fmean(costs) if costs else None,
+        })
+    return summary
+
+def run_benchmark(graph, landmarks, trials=200, workers=None, seed=0):
+    rng = random.Random(seed)
+    n = graph.number_of_nodes()
+    pairs = [(t, *rng.sample(range(n), 2)) for t in range(trials)]
+    #fork shares the parent's memory,so the graph is never pickled (falls back to the default elsewhere)
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=init_worker, initargs=(graph, landmarks)) as pool:
+        for trial_rows in pool.map(run_trial, pairs, chunksize=max(1, trials // (4 * (workers or os.cpu_count() or 1)))):
+            rows.extend(trial_rows)
+    return rows
+
+def write_results(rows, summary, csv_path, json_path):
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["trial", "algorithm", "src", "dest", "time_ns", "nodes", "cost"])
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(json_path, "w") as f:
+        json.dump({"summary": summary, "trials": rows}, f, indent=1)
+
 # Main
-n = 1000
-G = generate_connected_graph(n)
-#no of random source-dest pairs(3)
-trials = 3
-#dictionary with K-V pairs
-results = {"Algorithm": [], "Avg Time": [], "Avg Nodes": [], "Avg Cost": []}
-
-# store exetime,nonodes generated,cost
-bfs_times, dfs_times, ucs_times, ids_times = [], [], [], []
-bfs_nodes, dfs_nodes, ucs_nodes, ids_nodes = [], [], [], []
-ucs_costs = []
-
-for _ in range(trials):
-    #consider random source-dest nodes
-    src, dest = random.sample(range(n), 2)
-    
-    #storing execution time and no of nodes explored
-    #path = path from src to dest
-    #nodes = number of nodes explored
-    #cost = total cost (sum of edge weights) of the path
-    start_time = time.time()
-    path, nodes = bfs(G, src, dest)
-    bfs_times.append(time.time() - start_time)
-    bfs_nodes.append(nodes)
-    
-    start_time = time.time()
-    path, nodes = dfs(G, src, dest)
-    dfs_times.append(time.time() - start_time)
-    dfs_nodes.append(nodes)
-    
-    start_time = time.time()
-    path, nodes, cost = ucs(G, src, dest)
-    ucs_times.append(time.time() - start_time)
-    ucs_nodes.append(nodes)
-    ucs_costs.append(cost)
-    
-    start_time = time.time()
-    path, nodes = ids(G, src, dest)
-    ids_times.append(time.time() - start_time)
-    ids_nodes.append(nodes)
-
-# Prepare results
-results["Algorithm"] = ["BFS", "DFS", "UCS", "IDS"]
-results["Avg Time"] = [
-    sum(bfs_times)/trials, sum(dfs_times)/trials, sum(ucs_times)/trials, sum(ids_times)/trials
-]
-results["Avg Nodes"] = [
-    sum(bfs_nodes)/trials, sum(dfs_nodes)/trials, sum(ucs_nodes)/trials, sum(ids_nodes)/trials
-]
-#cost is only meaningful for ucs
-results["Avg Cost"] = [
-    None, None, sum(ucs_costs)/trials, None
-]
-
-# Print C-style table
-print("\n=== Average Results ===")
-print(f"{'Algorithm':<10} {'Avg Time (s)':<15} {'Avg Nodes':<12} {'Avg Cost':<10}")
-print("-" * 50)
-for i in range(len(results["Algorithm"])):
-    print(f"{results['Algorithm'][i]:<10} {results['Avg Time'][i]:<15.6f} {results['Avg Nodes'][i]:<12.2f} {str(results['Avg Cost'][i] or '-'): <10}")   
+if __name__ == "__main__":
+    n = 1000
+    seed = 0
+    random.seed(seed)
+    #connected by construction and already in CSR form
+    G = generate_connected_csr(n, edge_prob=0.01, seed=seed)
+    #landmarks are picked once per graph and cached on disk
+    landmarks = LandmarkIndex.load_or_build(f"landmarks_{n}.bin", G, k=8)
+    #hundreds of random source-dest pairs,3 were far too noisy to tell anything
+    trials = 300
+
+    rows = run_benchmark(G, landmarks, trials=trials, seed=seed)
+    summary = summarize(rows)
+    write_results(rows, summary, "graph_search_results.csv", "graph_search_results.json")
+
+    # Print C-style table
+    print(f"\n=== Results over {trials} trials ===")
+    print(f"{'Algorithm':<12} {'Median (ms)':<12} {'p95 (ms)':<12} {'Mean (ms)':<12} {'Avg Nodes':<12} {'Avg Cost':<10}")
+    print("-" * 72)
+    for row in summary:
+        cost = f"{row['mean_cost']:.2f}" if row["mean_cost"] is not None else "-"
+        print(f"{row['algorithm']:<12} {row['median_ms']:<12.4f} {row['p95_ms']:<12.4f} {row['mean_ms']:<12.4f} {row['mean_nodes']:<12.2f} {cost:<10}")
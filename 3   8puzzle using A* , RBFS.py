@@ -2,34 +2,57 @@ import heapq
 import math
 #for calcula execution time
 import time
+#pattern databases are saved to disk once and memory-mapped on later runs
+import mmap
+import os
+#batch heuristic for scoring many boards at once
+import numpy as np
 # Goal state
 goal_state = [[1,2,3],[4,5,6],[7,8,0]]
 goal_positions = {goal_state[i][j]:(i,j) for i in range(3) for j in range(3)}
 
+#goal for any size: 1..n*n-1 in order and the blank in the last cell
+def make_goal(n):
+    return [[(i*n + j + 1) % (n*n) for j in range(n)] for i in range(n)]
+
+#same rule as issolvable in the BFS script: the goal is reachable only if the inversion count is even
+#(odd width), or inversions + blank row counted from the bottom is odd (even width)
+def is_solvable(state):
+    n = len(state)
+    tiles = [t for row in state for t in row if t != 0]
+    inversions = sum(1 for i in range(len(tiles)) for j in range(i + 1, len(tiles)) if tiles[i] > tiles[j])
+    if n % 2 == 1:
+        return inversions % 2 == 0
+    blank_row_from_bottom = n - next(i for i in range(n) if 0 in state[i])
+    return (inversions + blank_row_from_bottom) % 2 == 1
+
 # Heuristic: Manhattan distance
 def manhattan(state):
+    n = len(state)
     distance = 0
-    for i in range(3):
-        for j in range(3):
+    for i in range(n):
+        for j in range(n):
             val = state[i][j]
             if val != 0:
-                gi, gj = goal_positions[val]
+                #tile val belongs at cell val-1 in the goal
+                gi, gj = divmod(val-1, n)
                 distance += abs(i-gi) + abs(j-gj)
     return distance
 
 #Get possible moves and then swap with neighbors
 #get_neighbors = “from current board, generate all boards after moving the blank tile in each legal direction”.
 def get_neighbors(state):
+    n = len(state)
     neighbors = []
     #loop through and find the blank tile
-    i, j = next((i,j) for i in range(3) for j in range(3) if state[i][j]==0)
+    i, j = next((i,j) for i in range(n) for j in range(n) if state[i][j]==0)
     #DURL directions it can move
     moves = [(1,0),(-1,0),(0,1),(0,-1)]
     for di, dj in moves:
         #new blank positions
         ni, nj = i+di, j+dj
         #validation.preventing the out of bounds
-        if 0 <= ni < 3 and 0 <= nj < 3:
+        if 0 <= ni < n and 0 <= nj < n:
             #copy of the current state
             new_state = [row[:] for row in state]
             #swwap the blank tile with other neighbor
@@ -41,88 +64,592 @@ def get_neighbors(state):
 def to_tuple(state):
     return tuple(tuple(row) for row in state)
 
+# ---------------- Additive Pattern Databases ---------------- #
+#Manhattan treats every tile alone, on the 15/24 puzzle that is way too optimistic.
+#A pattern database (PDB) stores the exact number of moves needed to bring a group of tiles home.
+#Only moves of the group's own tiles are counted (the blank walking around other tiles is free),
+#so disjoint groups can simply be added and the sum is still admissible.
+
+#cells next to each cell on an n x n board
+def adjacent_cells(n):
+    adj = []
+    for c in range(n*n):
+        i, j = divmod(c, n)
+        adj.append([ni*n + nj for ni, nj in ((i+1,j),(i-1,j),(i,j+1),(i,j-1)) if 0 <= ni < n and 0 <= nj < n])
+    return adj
+
+#An abstract state is where the pattern tiles are: an ordered choice of k distinct cells out of n*n.
+#It is stored by its rank (Lehmer code,like the distance table in the BFS script): digit i = cells[i]
+#minus the earlier cells that are smaller,so the ranks are exactly 0 .. (n*n)!/(n*n-k)! - 1.
+#15 puzzle,5 tiles: 524160 entries; 24 puzzle,6 tiles: 127.5 million (instead of 25**6 = 244 million).
+def pattern_table_size(n, k):
+    return math.perm(n*n, k)
+
+def rank_cells(cells, size):
+    rank = 0
+    #bit c set = cell c already used,popcount of the bits below c = how many earlier cells are smaller
+    used = 0
+    for i, c in enumerate(cells):
+        rank = rank * (size - i) + c - (used & ((1 << c) - 1)).bit_count()
+        used |= 1 << c
+    return rank
+
+def unrank_cells(rank, m, size):
+    digits = []
+    for i in range(m - 1, -1, -1):
+        rank, d = divmod(rank, size - i)
+        digits.append(d)
+    free = list(range(size))
+    return [free.pop(d) for d in reversed(digits)]
+
+#retrograde BFS from the goal over (cells of the pattern tiles, blank cell),ranked as k+1 cells.
+#The blank is the last digit,so rank // (n*n - k) is the rank of the tiles alone:
+#the table keeps the best distance over all blank cells under that index,one byte each.
+#Visited marks take 2 bits per state,state i at bits 2*(i%4) of byte i//4: 0 = never seen,
+#2 = waiting in the next layer, 3 = done (only ever OR-ed in, 0 -> 2 -> 3 or 0 -> 3).
+def build_pattern_table(n, pattern):
+    size = n*n
+    k = len(pattern)
+    base = size - k
+    #255 = not reached yet
+    table = bytearray(b'\xff') * pattern_table_size(n, k)
+    marks = bytearray((pattern_table_size(n, k + 1) + 3) // 4)
+    adj = adjacent_cells(n)
+    start = rank_cells([tile - 1 for tile in pattern] + [size - 1], size)
+    layer = [start]
+    depth = 0
+    while layer:
+        #flood fill entries carry the tile cells and the blank,only layer entries need unranking
+        stack = []
+        for idx in layer:
+            shift = (idx & 3) << 1
+            if (marks[idx >> 2] >> shift) & 3 == 2 or idx == start:
+                marks[idx >> 2] |= 3 << shift
+                cells = unrank_cells(idx, k + 1, size)
+                occupied = 0
+                for c in cells[:k]:
+                    occupied |= 1 << c
+                stack.append((idx, tuple(cells[:k]), occupied, cells[k]))
+        next_layer = []
+        #the blank sliding over non-pattern tiles costs 0 -> flood fill inside this layer
+        while stack:
+            idx, tiles, occupied, blank = stack.pop()
+            rest = idx // base
+            if table[rest] == 255:
+                table[rest] = depth
+            for to in adj[blank]:
+                if occupied >> to & 1:
+                    #swapping with a pattern tile costs 1 -> next layer
+                    moved = list(tiles)
+                    moved[tiles.index(to)] = blank
+                    moved.append(to)
+                    child = rank_cells(moved, size)
+                    shift = (child & 3) << 1
+                    if not (marks[child >> 2] >> shift) & 3:
+                        marks[child >> 2] |= 2 << shift
+                        next_layer.append(child)
+                else:
+                    #only the blank's digit changes: its cell minus the tile cells below it
+                    child = rest * base + to - (occupied & ((1 << to) - 1)).bit_count()
+                    shift = (child & 3) << 1
+                    if not (marks[child >> 2] >> shift) & 1:
+                        marks[child >> 2] |= 3 << shift
+                        stack.append((child, tiles, occupied, to))
+        layer = next_layer
+        depth += 1
+    return table
+
+class PatternDatabase:
+    #patterns = disjoint tile groups,e.g. [(1,2,3,4,5),(6,7,8,9,10),(11,12,13,14,15)] for the 15 puzzle
+    def __init__(self, n, patterns, tables):
+        self.n = n
+        self.patterns = [tuple(p) for p in patterns]
+        self.tables = tables
+
+    @classmethod
+    def build(cls, n, patterns):
+        return cls(n, patterns, [build_pattern_table(n, p) for p in patterns])
+
+    #file = one header line (size + patterns) followed by the raw tables back to back
+    #written to a temporary file and renamed into place,so nobody ever maps a half-written table
+    def save(self, path):
+        header = f"{self.n};" + ";".join(",".join(map(str, p)) for p in self.patterns) + "\n"
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(header.encode())
+            for table in self.tables:
+                f.write(table)
+        os.replace(tmp, path)
+
+    #ValueError if the file is empty,cut short or not a pattern database
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            header = f.readline().decode().strip().split(";")
+            #map the file instead of reading it,the OS pages in only what the search touches
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        n = int(header[0])
+        patterns = [tuple(int(t) for t in p.split(",")) for p in header[1:]]
+        view = memoryview(data)
+        offset = len(";".join(header).encode()) + 1
+        if len(data) != offset + sum(pattern_table_size(n, len(p)) for p in patterns):
+            raise ValueError(f"{path}: size does not match its header")
+        tables = []
+        for p in patterns:
+            length = pattern_table_size(n, len(p))
+            tables.append(view[offset:offset+length])
+            offset += length
+        return cls(n, patterns, tables)
+
+    #load from disk if we already built it for this size and these patterns,otherwise build once and save
+    @classmethod
+    def load_or_build(cls, path, n, patterns):
+        if os.path.exists(path):
+            try:
+                pdb = cls.load(path)
+                if pdb.n == n and pdb.patterns == [tuple(p) for p in patterns]:
+                    return pdb
+            #damaged file (interrupted write,older format): build it again
+            except ValueError:
+                pass
+        pdb = cls.build(n, patterns)
+        pdb.save(path)
+        return cls.load(path)
+
+    #used exactly like manhattan(state)
+    def __call__(self, state):
+        return self.flat(flatten(state))
+
+    #same lookup on a flat board tuple (what the searches work on)
+    def flat(self, board):
+        pos = [0] * len(board)
+        for cell, tile in enumerate(board):
+            pos[tile] = cell
+        size = len(board)
+        h = 0
+        for table, pattern in zip(self.tables, self.patterns):
+            h += table[rank_cells([pos[tile] for tile in pattern], size)]
+        return h
+
+# ---------------- Incremental Manhattan ---------------- #
+#The searches work on flat tuples (cell c = i*n + j) and every node carries its blank cell and its h,
+#so nobody has to look for the 0 again or rescore the whole board.
+#Sliding one tile changes manhattan by exactly +1 or -1, which we read from a table.
+def flatten(state):
+    return tuple(v for row in state for v in row)
+
+def unflatten(board, n):
+    return [list(board[i*n:(i+1)*n]) for i in range(n)]
+
+#delta[tile][frm][to] = change of manhattan when tile slides from cell frm to cell to
+delta_tables = {}
+def manhattan_delta_table(n):
+    if n not in delta_tables:
+        size = n*n
+        dist = [[0]*size for _ in range(size)]
+        for tile in range(1, size):
+            gi, gj = divmod(tile-1, n)
+            for c in range(size):
+                i, j = divmod(c, n)
+                dist[tile][c] = abs(i-gi) + abs(j-gj)
+        delta_tables[n] = [[[dist[tile][to] - dist[tile][frm] for to in range(size)] for frm in range(size)] for tile in range(size)]
+    return delta_tables[n]
+
+#how a child's h is worked out from its parent's
+def h_updater(heuristic, n):
+    if heuristic is manhattan:
+        delta = manhattan_delta_table(n)
+        return lambda h, tile, frm, to, child: h + delta[tile][frm][to]
+    #pattern databases have a flat lookup,anything else gets the 2d board
+    if hasattr(heuristic, "flat"):
+        return lambda h, tile, frm, to, child: heuristic.flat(child)
+    return lambda h, tile, frm, to, child: heuristic(unflatten(child, n))
+
+#children of (board, blank, h): the tile next to the blank slides into it
+def expand(board, blank, h, adj, update):
+    for cell in adj[blank]:
+        tile = board[cell]
+        child = list(board)
+        child[blank] = tile
+        child[cell] = 0
+        child = tuple(child)
+        yield child, cell, update(h, tile, cell, blank, child)
+
+#Manhattan of many boards in one numpy call (dataset generation etc)
+#boards: array-like of shape (m, n, n) or (m, n*n) -> int array of m distances
+def manhattan_batch(boards, n=None):
+    boards = np.asarray(boards)
+    if n is None:
+        n = boards.shape[1] if boards.ndim == 3 else math.isqrt(boards.shape[1])
+    boards = boards.reshape(len(boards), n*n)
+    cells = np.arange(n*n)
+    #goal cell of every tile (the blank is masked out below)
+    goal_cells = boards - 1
+    dist = np.abs(cells // n - goal_cells // n) + np.abs(cells % n - goal_cells % n)
+    return np.where(boards != 0, dist, 0).sum(axis=1)
+
 # ---------------- A* Search ---------------- #
 #start positin of puzzle
-def astar(start):
+#heuristic = manhattan by default, or a PatternDatabase for the bigger boards
+#returns (path, stats): stats counts expanded/generated nodes and the biggest the frontier ever got
+def astar(start, heuristic=manhattan):
+    n = len(start)
+    goal = flatten(make_goal(n))
+    adj = adjacent_cells(n)
+    update = h_updater(heuristic, n)
+    board = flatten(start)
+    h = heuristic(start)
+    stats = {"expanded": 0, "generated": 1, "peak_frontier": 1}
+    #the frontier would have to run through the whole other parity class first
+    if not is_solvable(start):
+        return None, stats
+    #cheapest g found so far for every board + who generated it,the path is rebuilt only at the end
+    #no closed set: a board is expanded again when a cheaper g turns up (reopening),
+    #the pattern databases are admissible but not consistent,so that does happen
+    best_g = {board: 0}
+    parent = {board: None}
+    #counter = insertion order,so ties never fall through to comparing boards
+    counter = 0
     #unexplored nodes
     frontier = []
-    #priority q                f(n)            g(n) curr  path till now
-    heapq.heappush(frontier, (manhattan(start), 0, start, []))
-    explored = set()
+    #priority q          f(n) -g(n) tie  curr  blank cell     h
+    heapq.heappush(frontier, (h, 0, counter, board, board.index(0), h))
 
     while frontier:
-        #pick the best/min one
-        f, g, state, path = heapq.heappop(frontier)
+        #pick the best/min one (equal f -> deeper node first, it is closer to the goal)
+        f, neg_g, _, board, blank, h = heapq.heappop(frontier)
+        g = -neg_g
+        #stale entry: a cheaper copy of this board was pushed later (lazy deletion instead of decrease-key)
+        if g > best_g[board]:
+            continue
         #if curr is goal then return
-        if state == goal_state:
+        if board == goal:
             #ret path
-            return path+[state]
-        explored.add(to_tuple(state))
+            path = []
+            while board is not None:
+                path.append(unflatten(board, n))
+                board = parent[board]
+            path.reverse()
+            return path, stats
+        stats["expanded"] += 1
         #add possible states
-        for neighbor in get_neighbors(state):
-            if to_tuple(neighbor) not in explored:
-                heapq.heappush(frontier,(g+1+manhattan(neighbor), g+1, neighbor, path+[state]))
-    return None #unsolvable
+        for child, child_blank, child_h in expand(board, blank, h, adj, update):
+            if g+1 >= best_g.get(child, math.inf):
+                continue
+            best_g[child] = g+1
+            parent[child] = board
+            counter += 1
+            heapq.heappush(frontier,(g+1+child_h, -(g+1), counter, child, child_blank, child_h))
+            stats["generated"] += 1
+        if len(frontier) > stats["peak_frontier"]:
+            stats["peak_frontier"] = len(frontier)
+    return None, stats #unsolvable
 #g(n) = how many steps you already walked.
 #h(n) = how many steps you think are left.
 #f(n) = total journey (walked + remaining).
 
 # ---------------- RBFS ---------------- #
 #Think of RBFS like “explore the best path first, but keep an eye on the 2nd best in case you need to backtrack.”
-def rbfs(start):
-    def rbfs_recursive(state, path, g, f_limit):
+def rbfs(start, heuristic=manhattan):
+    n = len(start)
+    #the f limits would keep growing forever on an unreachable goal
+    if not is_solvable(start):
+        return None
+    goal = flatten(make_goal(n))
+    adj = adjacent_cells(n)
+    update = h_updater(heuristic, n)
+    def rbfs_recursive(state, blank, h, path, g, f_limit):
         #checks if goal
-        if state == goal_state:
+        if state == goal:
             return path+[state], 0
         successors = []
-        for neighbor in get_neighbors(state):
+        for neighbor, nblank, nh in expand(state, blank, h, adj, update):
             #ensures f doesn’t go backward (
-            fval = max(g+1+manhattan(neighbor), g+1)
-            successors.append([neighbor, path+[state], g+1, fval])
+            fval = max(g+1+nh, g+1)
+            successors.append([neighbor, nblank, nh, path+[state], g+1, fval])
         if not successors:
             return None, math.inf
         while True:
-            successors.sort(key=lambda x:x[3])
-            #[3] comes coz you have indexes in successors
+            successors.sort(key=lambda x:x[5])
+            #[5] comes coz you have indexes in successors
             best = successors[0]
-            if best[3] > f_limit:
-                return None, best[3]
-            alternative = successors[1][3] if len(successors)>1 else math.inf
-            result, best[3] = rbfs_recursive(best[0], best[1], best[2], min(f_limit, alternative))
+            if best[5] > f_limit:
+                return None, best[5]
+            alternative = successors[1][5] if len(successors)>1 else math.inf
+            result, best[5] = rbfs_recursive(best[0], best[1], best[2], best[3], best[4], min(f_limit, alternative))
             if result is not None:
                 return result, 0
             #Start recursion with empty path, cost=0, and infinite f-limit
-    return rbfs_recursive(start, [], 0, math.inf)[0]
-
-# ---------------- Test ---------------- #
-start_state = [[1,2,3],[5,0,6],[4,7,8]]
-
-print("Solving with A*:")
-t1 = time.time()
-path_astar = astar(start_state)
-t2 = time.time()
-for s in path_astar:
-    for row in s: print(row)
-    print()
-
-print("Solving with RBFS:")
-t3 = time.time()
-path_rbfs = rbfs(start_state)
-t4 = time.time()
-for s in path_rbfs:
-    for row in s: print(row)
-    print()
-
-# ---------------- Performance Summary ---------------- #
-# Cost = number of steps (path length - 1)
-cost_astar = len(path_astar) - 1 if path_astar else None
-cost_rbfs = len(path_rbfs) - 1 if path_rbfs else None
-time_astar = (t2 - t1) * 1000
-time_rbfs = (t4 - t3) * 1000
-
-# Print results as a simple table (no extra libraries needed)
-print("\n------ Performance Comparison ------")
-print(f"{'Algorithm':<10} | {'Cost (steps)':<12} | {'Execution Time (ms)':<20}")
-print("-" * 50)
-print(f"{'A*':<10} | {cost_astar:<12} | {time_astar:<20.3f}")
-print(f"{'RBFS':<10} | {cost_rbfs:<12} | {time_rbfs:<20.3f}")
+    board = flatten(start)
+    path = rbfs_recursive(board, board.index(0), heuristic(start), [], 0, math.inf)[0]
+    return [unflatten(b, n) for b in path] if path is not None else None
+
+# ---------------- IDA* ---------------- #
+#Depth-first with an f bound that grows to the smallest f that went over it last time.
+#Memory = one board + the blank cells on the current path,no matter how hard the instance is.
+#Tiles are moved in place and moved back (make/unmake),and we never slide the tile we just moved straight back.
+def ida_star(start, heuristic=manhattan):
+    n = len(start)
+    goal = list(flatten(make_goal(n)))
+    adj = adjacent_cells(n)
+    update = h_updater(heuristic, n)
+    board = list(flatten(start))
+    stats = {"expanded": 0, "generated": 1, "iterations": 0}
+    #the bound would grow forever on an unreachable goal
+    if not is_solvable(start):
+        return None, stats
+    #blank cell after every move,enough to replay the path at the end
+    blanks = [board.index(0)]
+
+    def search(blank, prev, g, h, bound):
+        f = g + h
+        if f > bound:
+            return f
+        if h == 0 and board == goal:
+            return True
+        stats["expanded"] += 1
+        minimum = math.inf
+        for cell in adj[blank]:
+            #parent-move prune: going back to where the blank just was only undoes the last move
+            if cell == prev:
+                continue
+            #make move
+            tile = board[cell]
+            board[blank] = tile
+            board[cell] = 0
+            stats["generated"] += 1
+            blanks.append(cell)
+            t = search(cell, blank, g+1, update(h, tile, cell, blank, board), bound)
+            if t is True:
+                return True
+            #unmake move
+            blanks.pop()
+            board[cell] = tile
+            board[blank] = 0
+            if t < minimum:
+                minimum = t
+        return minimum
+
+    start_board = flatten(start)
+    h = heuristic(start)
+    bound = h
+    while True:
+        stats["iterations"] += 1
+        t = search(blanks[0], -1, 0, h, bound)
+        if t is True:
+            break
+        if t == math.inf:
+            return None, stats
+        bound = t
+    #replay the blank moves on a fresh copy of the start
+    path = [start]
+    current = list(start_board)
+    for frm, to in zip(blanks, blanks[1:]):
+        current[frm], current[to] = current[to], 0
+        path.append(unflatten(current, n))
+    return path, stats
+
+# ---------------- SMA* ---------------- #
+#Simplified memory-bounded A*: behaves like A* until max_nodes nodes are in memory,
+#then drops the worst leaf (highest f, shallowest) and remembers its f in the parent,
+#so the parent can regenerate that branch later if everything else turns out worse.
+#Optimal as long as the budget is bigger than the solution depth.
+class SMANode:
+    __slots__ = ("board", "blank", "g", "h", "f", "depth", "parent", "children",
+                 "pending", "forgot", "in_open", "version")
+
+    def __init__(self, board, blank, g, h, f, parent):
+        self.board = board
+        self.blank = blank
+        self.g = g
+        self.h = h
+        self.f = f
+        self.depth = g
+        self.parent = parent
+        #successors currently in memory
+        self.children = []
+        #blank cells we still have to (re)generate,the move back to the parent is left out
+        self.pending = []
+        #blank cell -> f of a successor that was dropped to free memory
+        self.forgot = {}
+        self.in_open = False
+        #bumped on every change so old heap entries can be recognised and skipped
+        self.version = 0
+
+def sma_star(start, heuristic=manhattan, max_nodes=100000):
+    n = len(start)
+    goal = flatten(make_goal(n))
+    adj = adjacent_cells(n)
+    update = h_updater(heuristic, n)
+    stats = {"expanded": 0, "generated": 1, "forgotten": 0, "peak_memory": 1}
+    #it would keep forgetting and regrowing the same nodes on an unreachable goal
+    if not is_solvable(start):
+        return None, stats
+    #open list as two lazy heaps: best = (lowest f, deepest), worst = (highest f, shallowest)
+    best_heap, worst_heap = [], []
+    counter = 0
+
+    def push(node):
+        nonlocal counter
+        node.in_open = True
+        node.version += 1
+        counter += 1
+        heapq.heappush(best_heap, (node.f, -node.depth, counter, node.version, node))
+        heapq.heappush(worst_heap, (-node.f, node.depth, counter, node.version, node))
+
+    def remove(node):
+        node.in_open = False
+        node.version += 1
+
+    def valid(entry):
+        return entry[4].in_open and entry[3] == entry[4].version
+
+    #f of a node whose successors all went through memory = min over them (in memory or forgotten)
+    def backup(node):
+        while node is not None:
+            if len(node.pending) > len(node.forgot):
+                return
+            values = [c.f for c in node.children] + list(node.forgot.values())
+            new_f = min(values) if values else math.inf
+            if new_f == node.f:
+                return
+            node.f = new_f
+            if node.in_open:
+                push(node)
+            node = node.parent
+
+    board = flatten(start)
+    h = heuristic(start)
+    root = SMANode(board, board.index(0), 0, h, h, None)
+    root.pending = list(adj[root.blank])
+    push(root)
+    used = 1
+
+    while best_heap:
+        if not valid(best_heap[0]):
+            heapq.heappop(best_heap)
+            continue
+        b = best_heap[0][4]
+        if b.f == math.inf:
+            break
+        if b.board == goal:
+            path = []
+            while b is not None:
+                path.append(unflatten(b.board, n))
+                b = b.parent
+            path.reverse()
+            return path, stats
+        stats["expanded"] += 1
+        #never-generated successors first,then the forgotten one with the lowest f
+        fresh = [c for c in b.pending if c not in b.forgot]
+        cell = fresh[0] if fresh else min(b.pending, key=b.forgot.get)
+        b.pending.remove(cell)
+        tile = b.board[cell]
+        child_board = list(b.board)
+        child_board[b.blank] = tile
+        child_board[cell] = 0
+        child_board = tuple(child_board)
+        child_h = update(b.h, tile, cell, b.blank, child_board)
+        if cell in b.forgot:
+            child_f = b.forgot.pop(cell)
+        else:
+            child_f = max(b.f, b.g+1+child_h)
+        #too deep to ever fit a full path in memory
+        if b.depth+1 >= max_nodes-1 and child_board != goal:
+            child_f = math.inf
+        s = SMANode(child_board, cell, b.g+1, child_h, child_f, b)
+        s.pending = [c for c in adj[cell] if c != b.blank]
+        b.children.append(s)
+        stats["generated"] += 1
+        if not b.pending:
+            #every successor is in memory,b is an interior node now
+            remove(b)
+        backup(b)
+        #memory full -> drop the worst leaf and let its parent remember it
+        if used >= max_nodes:
+            while worst_heap:
+                entry = heapq.heappop(worst_heap)
+                w = entry[4]
+                #interior nodes are dropped from this heap for good,they get pushed again once they are leaves
+                if not valid(entry) or w.children or w.parent is None:
+                    continue
+                remove(w)
+                parent = w.parent
+                parent.children.remove(w)
+                parent.forgot[w.blank] = w.f
+                parent.pending.append(w.blank)
+                push(parent)
+                used -= 1
+                stats["forgotten"] += 1
+                break
+        push(s)
+        used += 1
+        if used > stats["peak_memory"]:
+            stats["peak_memory"] = used
+    return None, stats
+
+if __name__ == "__main__":
+    # ---------------- Test ---------------- #
+    start_state = [[1,2,3],[5,0,6],[4,7,8]]
+
+    print("Solving with A*:")
+    t1 = time.time()
+    path_astar, stats_astar = astar(start_state)
+    t2 = time.time()
+    for s in path_astar:
+        for row in s: print(row)
+        print()
+
+    print("Solving with RBFS:")
+    t3 = time.time()
+    path_rbfs = rbfs(start_state)
+    t4 = time.time()
+    for s in path_rbfs:
+        for row in s: print(row)
+        print()
+
+    print("Solving with IDA*:")
+    t7 = time.time()
+    path_ida, stats_ida = ida_star(start_state)
+    t8 = time.time()
+
+    print("Solving with SMA* (budget 1000 nodes):")
+    t9 = time.time()
+    path_sma, stats_sma = sma_star(start_state, max_nodes=1000)
+    t10 = time.time()
+
+    # ---------------- Performance Summary ---------------- #
+    # Cost = number of steps (path length - 1)
+    cost_astar = len(path_astar) - 1 if path_astar else None
+    cost_rbfs = len(path_rbfs) - 1 if path_rbfs else None
+    time_astar = (t2 - t1) * 1000
+    time_rbfs = (t4 - t3) * 1000
+
+    # Print results as a simple table (no extra libraries needed)
+    print("\n------ Performance Comparison ------")
+    print(f"{'Algorithm':<10} | {'Cost (steps)':<12} | {'Execution Time (ms)':<20}")
+    print("-" * 50)
+    print(f"{'A*':<10} | {cost_astar:<12} | {time_astar:<20.3f}")
+    print(f"{'RBFS':<10} | {cost_rbfs:<12} | {time_rbfs:<20.3f}")
+    print(f"{'IDA*':<10} | {len(path_ida) - 1:<12} | {(t8 - t7) * 1000:<20.3f}")
+    print(f"{'SMA*':<10} | {len(path_sma) - 1:<12} | {(t10 - t9) * 1000:<20.3f}")
+    print(f"A* expanded {stats_astar['expanded']}, generated {stats_astar['generated']}, peak frontier {stats_astar['peak_frontier']}")
+
+    # ---------------- 15 Puzzle with a 5-5-5 PDB ---------------- #
+    #the tables are built once (a minute or two in pure python) and saved,later runs just map the file
+    pdb_file = "15puzzle_555.pdb"
+    if not os.path.exists(pdb_file):
+        print(f"\nBuilding the 15 puzzle pattern database (first run only, saved to {pdb_file})...")
+    pdb15 = PatternDatabase.load_or_build(pdb_file, 4, [(1,2,3,4,5),(6,7,8,9,10),(11,12,13,14,15)])
+    #56 moves from the goal: Manhattan says 48,the PDB 50
+    start_15 = [[11,14,12,15],[8,4,13,1],[0,3,2,10],[6,5,7,9]]
+    print("\nSolving 15 puzzle with A* + PDB:")
+    t5 = time.time()
+    path_15, stats_15 = astar(start_15, heuristic=pdb15)
+    t6 = time.time()
+    print(f"Cost (steps): {len(path_15) - 1}, Execution Time (ms): {(t6 - t5) * 1000:.3f}, Expanded: {stats_15['expanded']}")
+    print("Same board with IDA* + Manhattan:")
+    t11 = time.time()
+    path_m, stats_m = ida_star(start_15)
+    t12 = time.time()
+    print(f"Cost (steps): {len(path_m) - 1}, Execution Time (ms): {(t12 - t11) * 1000:.3f}, Expanded: {stats_m['expanded']}")
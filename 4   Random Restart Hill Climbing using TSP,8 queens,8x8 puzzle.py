@@ -3,6 +3,12 @@ import math
 #taking a copy of nested lists
 import copy
 import time
+from collections import deque
+#parallel restarts
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+#vectorized costs for many boards at once
+import numpy as np
 #used to print tables in a nice formatted way (instead of just raw lists).
 from tabulate import tabulate
 
@@ -10,7 +16,24 @@ from tabulate import tabulate
 #The problem object (TSP, 8-puzzle, or 8-queens).
 #no of times to restart the hill climbing from diff random initial state
 #Maximum steps allowed per restart (to prevent infinite loops).
-def random_restart_hill_climb(problem, restarts=10, max_steps=1000):
+#strategy: "best" = take the best improving move, "first" = take the first improving move found
+#(only used by problems with the move API below, the others always take the best neighbour)
+#seed: restart r draws its start from its own Random(seed, r), so the result only depends on the seed
+#workers > 1: restarts run in a process pool and give exactly the same answer as workers=1
+#target: stop as soon as a restart reaches cost <= target (e.g. 0 conflicts for 8 queens)
+#neighborhood: "full" = every move/neighbour as above,
+#  "candidates" = the problem's own candidate-list climb (TSP: 2-opt over k nearest cities + don't-look bits)
+def random_restart_hill_climb(problem, restarts=10, max_steps=1000, strategy="best",
+                              seed=None, workers=None, target=None, neighborhood="full"):
+    if neighborhood == "candidates":
+        #build the candidate lists once here,so pool workers get them with the problem
+        problem.neighbor_lists()
+    elif neighborhood != "full":
+        raise ValueError(f"unknown neighborhood: {neighborhood}")
+    if workers is not None and workers > 1:
+        if seed is None:
+            seed = random.randrange(2**32)
+        return parallel_restarts(problem, restarts, max_steps, strategy, seed, workers, target, neighborhood)
     #Stores the overall best solution found across all restarts.
     best_solution = None
     #Stores the lowest cost found so far, initialized to infinity so any real solution will be better.
@@ -18,59 +41,624 @@ def random_restart_hill_climb(problem, restarts=10, max_steps=1000):
 
     for r in range(restarts):
         #This is the key idea of random restart → avoid local minima.
-        current = problem.random_state()
-        for step in range(max_steps):
-            neighbors = problem.get_neighbors(current)
-            #stop climbing.
-            if not neighbors:
-                break
-            #Choose the best neighbor (lowest cost) among all neighbors.
-            next_state = min(neighbors, key=problem.cost)
-            if problem.cost(next_state) < problem.cost(current):
-                current = next_state
-            else:
-                break
-
-        current_cost = problem.cost(current)
+        rng = restart_rng(seed, r)
+        current, current_cost = run_restart(problem, rng, max_steps, strategy, neighborhood=neighborhood)
         if current_cost < best_cost:
             best_solution = current
             best_cost = current_cost
+        if target is not None and best_cost <= target:
+            break
+
+    return best_solution, best_cost
 
+#no seed -> the global random module like before
+def restart_rng(seed, r):
+    return random if seed is None else random.Random(f"{seed}:{r}")
+
+def run_restart(problem, rng, max_steps, strategy, stop=None, neighborhood="full"):
+    current = problem.random_state(rng)
+    if neighborhood == "candidates":
+        return problem.climb_candidates(current, max_steps, stop)
+    if hasattr(problem, "moves"):
+        return climb_moves(problem, current, max_steps, strategy, stop)
+    return climb_neighbors(problem, current, max_steps, stop)
+
+# ---------------------- Parallel restarts ----------------------
+#Every worker gets the problem once (pool initializer) and then only restart numbers.
+#first_hit = lowest restart number that reached the target so far, shared by all workers:
+#restarts after it are skipped (or abandoned mid-climb) because serial mode would never have run them.
+#Picking the lowest (cost, restart number) among the rest is exactly what the serial loop returns.
+worker_state = {}
+
+def init_restart_worker(problem, max_steps, strategy, seed, target, first_hit, neighborhood):
+    worker_state.update(problem=problem, max_steps=max_steps, strategy=strategy,
+                        seed=seed, target=target, first_hit=first_hit, neighborhood=neighborhood)
+
+def restart_job(r):
+    w = worker_state
+    first_hit = w["first_hit"]
+    if r > first_hit.value:
+        return r, None, float('inf')
+    stop = lambda: r > first_hit.value
+    state, cost = run_restart(w["problem"], restart_rng(w["seed"], r), w["max_steps"], w["strategy"], stop,
+                              w["neighborhood"])
+    if r > first_hit.value:
+        return r, None, float('inf')
+    if w["target"] is not None and cost <= w["target"]:
+        with first_hit.get_lock():
+            if r < first_hit.value:
+                first_hit.value = r
+    return r, state, cost
+
+def parallel_restarts(problem, restarts, max_steps, strategy, seed, workers, target, neighborhood="full"):
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    first_hit = context.Value('q', restarts)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=init_restart_worker,
+                             initargs=(problem, max_steps, strategy, seed, target, first_hit,
+                                       neighborhood)) as pool:
+        results = list(pool.map(restart_job, range(restarts)))
+    best_solution, best_cost = None, float('inf')
+    for r, state, cost in results:
+        if r <= first_hit.value and cost < best_cost:
+            best_solution, best_cost = state, cost
     return best_solution, best_cost
 
+#one climb on the full neighbour list: get_neighbors + cost on every neighbour
+#stop: optional callable,checked now and then to give up early (parallel restarts)
+def climb_neighbors(problem, current, max_steps, stop=None):
+    current_cost = problem.cost(current)
+    for step in range(max_steps):
+        if stop is not None and step % 64 == 0 and stop():
+            break
+        neighbors = problem.get_neighbors(current)
+        #stop climbing.
+        if not neighbors:
+            break
+        #Choose the best neighbor (lowest cost) among all neighbors.
+        next_state = min(neighbors, key=problem.cost)
+        next_cost = problem.cost(next_state)
+        if next_cost < current_cost:
+            current, current_cost = next_state, next_cost
+        else:
+            break
+    return current, current_cost
+
+#Move API: instead of building every neighbour,a problem can offer
+#  moves(state)        -> small move descriptors (tuples)
+#  delta(state, move)  -> cost change of that move in O(1)
+#  apply(state, move)  -> the state after the move
+#so one step costs O(1) per move looked at and nothing is copied until we actually move.
+#A move only counts as downhill if it gains more than this: float TSP deltas of moves that change
+#nothing come out as -1e-13 or so,and taking those would cycle between equivalent tours
+MIN_GAIN = 1e-9
+
+def climb_moves(problem, current, max_steps, strategy="best", stop=None):
+    current_cost = problem.cost(current)
+    for step in range(max_steps):
+        if stop is not None and step % 64 == 0 and stop():
+            break
+        chosen, chosen_delta = None, -MIN_GAIN
+        for move in problem.moves(current):
+            d = problem.delta(current, move)
+            if d < chosen_delta:
+                chosen, chosen_delta = move, d
+                if strategy == "first":
+                    break
+        #no improving move -> local minimum
+        if chosen is None:
+            break
+        current = problem.apply(current, chosen)
+        current_cost += chosen_delta
+    return current, current_cost
+
+# ---------------------- Metaheuristics ----------------------
+#Hill climbing only ever goes down,so it sits in the first local minimum and restarts are the only way out.
+#These engines can also take worse moves and run on the same problem objects:
+#  move API (moves/delta/apply, plus random_move for sampling) when the problem has it,
+#  otherwise random_state/get_neighbors/cost.
+#Budget: max_evals = cost/delta evaluations, time_limit = seconds; whichever runs out first.
+#on_progress: called with {"engine", "evals", "time", "best_cost"} every time the best cost improves.
+#target: stop once best_cost <= target. All of them return (best_solution, best_cost).
+
+class SearchRun:
+    #budget + best-so-far bookkeeping shared by the engines
+    def __init__(self, engine, state, cost, max_evals, time_limit, target, on_progress):
+        self.engine = engine
+        self.max_evals = max_evals
+        self.time_limit = time_limit
+        self.target = target
+        self.on_progress = on_progress
+        self.start = time.perf_counter()
+        self.evals = 0
+        self.best_cost = float('inf')
+        self.best = None
+        self.offer(state, cost)
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    #0..1,how much of the budget is used up (drives the cooling schedules)
+    def progress(self):
+        used = 0.0
+        if self.max_evals is not None:
+            used = self.evals / self.max_evals
+        if self.time_limit is not None:
+            used = max(used, self.elapsed() / self.time_limit)
+        return min(used, 1.0)
+
+    def done(self):
+        if self.target is not None and self.best_cost <= self.target:
+            return True
+        if self.max_evals is not None and self.evals >= self.max_evals:
+            return True
+        return self.time_limit is not None and self.elapsed() >= self.time_limit
+
+    def offer(self, state, cost):
+        if cost < self.best_cost:
+            #some problems change their state in place (NQueens),so keep our own copy of the best
+            self.best = copy.deepcopy(state)
+            self.best_cost = cost
+            if self.on_progress is not None:
+                self.on_progress({"engine": self.engine, "evals": self.evals,
+                                  "time": self.elapsed(), "best_cost": cost})
+
+def engine_rng(seed):
+    return random if seed is None else random.Random(seed)
+
+#one random neighbour -> (step, cost change); a step is a move (move API) or the neighbour itself
+#None when the state has no neighbours at all (random_move returns None then,like an empty moves())
+def random_step(problem, state, cost, rng):
+    if hasattr(problem, "moves"):
+        if hasattr(problem, "random_move"):
+            move = problem.random_move(state, rng)
+        else:
+            moves = list(problem.moves(state))
+            move = rng.choice(moves) if moves else None
+        if move is None:
+            return None
+        return move, problem.delta(state, move)
+    neighbors = problem.get_neighbors(state)
+    if not neighbors:
+        return None
+    neighbor = rng.choice(neighbors)
+    return neighbor, problem.cost(neighbor) - cost
+
+#candidate steps for one tabu iteration: `candidates` random moves,or every neighbour ([] if there are none)
+def candidate_steps(problem, state, cost, rng, candidates):
+    if hasattr(problem, "moves"):
+        if candidates is not None and hasattr(problem, "random_move"):
+            if problem.random_move(state, rng) is None:
+                return []
+            moves = [problem.random_move(state, rng) for _ in range(candidates)]
+        else:
+            moves = list(problem.moves(state))
+        return [(move, problem.delta(state, move)) for move in moves]
+    return [(neighbor, problem.cost(neighbor) - cost) for neighbor in problem.get_neighbors(state)]
+
+def take_step(problem, state, step):
+    return problem.apply(state, step) if hasattr(problem, "moves") else step
+
+#nested lists -> nested tuples so a state can be a dict key
+def freeze(state):
+    return tuple(freeze(x) if isinstance(x, list) else x for x in state)
+
+#tabu attributes of a step: (what it adds, what it drops)
+#a step is tabu if it adds something dropped recently. Problems can say this themselves with tabu_key
+#(TSP: edges, NQueens: (column, row)); without it a move blocks itself and a neighbour blocks the state we left.
+def tabu_attributes(problem, state, step):
+    if hasattr(problem, "tabu_key"):
+        return problem.tabu_key(state, step)
+    if hasattr(problem, "moves"):
+        return (step,), (step,)
+    return (freeze(step),), (freeze(state),)
+
+#---- cooling schedules: cooling(t0, step, progress) -> temperature ----
+#progress-based ones spread the whole cooling over the budget,whatever it is
+def geometric_cooling(alpha=0.999):
+    return lambda t0, step, progress: t0 * alpha ** step
+
+def linear_cooling():
+    return lambda t0, step, progress: t0 * (1 - progress)
+
+#t0 down to t0*final at the end of the budget
+def exponential_cooling(final=1e-3):
+    return lambda t0, step, progress: t0 * final ** progress
+
+#start hot enough that an average uphill step is taken 80% of the time
+def initial_temperature(problem, state, cost, rng, samples=100):
+    uphill = []
+    for _ in range(samples):
+        step = random_step(problem, state, cost, rng)
+        if step is None:
+            break
+        if step[1] > 0:
+            uphill.append(step[1])
+    if not uphill:
+        return 1.0
+    return -(sum(uphill) / len(uphill)) / math.log(0.8)
+
+def simulated_annealing(problem, cooling=None, t0=None, max_evals=100000, time_limit=None,
+                        seed=None, target=None, on_progress=None):
+    rng = engine_rng(seed)
+    if cooling is None:
+        cooling = exponential_cooling()
+    current = problem.random_state(rng)
+    current_cost = problem.cost(current)
+    if t0 is None:
+        t0 = initial_temperature(problem, current, current_cost, rng)
+    run = SearchRun("annealing", current, current_cost, max_evals, time_limit, target, on_progress)
+    step = 0
+    while not run.done():
+        temperature = cooling(t0, step, run.progress())
+        drawn = random_step(problem, current, current_cost, rng)
+        #no neighbours: the start state is all there is
+        if drawn is None:
+            break
+        move, d = drawn
+        run.evals += 1
+        step += 1
+        #always downhill,uphill with probability e^(-d/T)
+        if d <= 0 or (temperature > 0 and rng.random() < math.exp(-d / temperature)):
+            current = take_step(problem, current, move)
+            current_cost += d
+            run.offer(current, current_cost)
+    return run.best, run.best_cost
+
+#every iteration takes the best non-tabu candidate,even if it is worse than where we are
+#aspiration: a tabu step is still allowed when it beats the best cost found so far
+def tabu_search(problem, tenure=7, candidates=1000, max_evals=100000, time_limit=None,
+                seed=None, target=None, on_progress=None):
+    rng = engine_rng(seed)
+    current = problem.random_state(rng)
+    current_cost = problem.cost(current)
+    run = SearchRun("tabu", current, current_cost, max_evals, time_limit, target, on_progress)
+    #attribute -> last iteration it is still tabu
+    tabu = {}
+    it = 0
+    while not run.done():
+        it += 1
+        chosen, chosen_delta, chosen_drops = None, float('inf'), ()
+        steps = candidate_steps(problem, current, current_cost, rng, candidates)
+        if not steps:
+            break
+        for step, d in steps:
+            run.evals += 1
+            if d >= chosen_delta:
+                continue
+            adds, drops = tabu_attributes(problem, current, step)
+            if current_cost + d >= run.best_cost and any(tabu.get(a, 0) >= it for a in adds):
+                continue
+            chosen, chosen_delta, chosen_drops = step, d, drops
+        #everything was tabu,draw new candidates
+        if chosen is None:
+            continue
+        current = take_step(problem, current, chosen)
+        current_cost += chosen_delta
+        for attribute in chosen_drops:
+            tabu[attribute] = it + tenure
+        run.offer(current, current_cost)
+    return run.best, run.best_cost
+
+#late acceptance (Burke & Bykov): a candidate is taken if it is no worse than the current cost
+#or than the cost we had `history` iterations ago -> no temperature to tune,only the history length
+def late_acceptance(problem, history=20, max_evals=100000, time_limit=None,
+                    seed=None, target=None, on_progress=None):
+    rng = engine_rng(seed)
+    current = problem.random_state(rng)
+    current_cost = problem.cost(current)
+    run = SearchRun("late acceptance", current, current_cost, max_evals, time_limit, target, on_progress)
+    costs = [current_cost] * history
+    k = 0
+    while not run.done():
+        drawn = random_step(problem, current, current_cost, rng)
+        if drawn is None:
+            break
+        move, d = drawn
+        run.evals += 1
+        candidate = current_cost + d
+        v = k % history
+        if candidate <= costs[v] or candidate <= current_cost:
+            current = take_step(problem, current, move)
+            current_cost = candidate
+            run.offer(current, current_cost)
+        costs[v] = current_cost
+        k += 1
+    return run.best, run.best_cost
+
 # ---------------------- Travelling Salesman Problem ----------------------
+#TSPLIB edge weight types for cities given as coordinates: name -> (one distance, numpy arrays of distances)
+#None = plain Euclidean as a float
+def _att(dx, dy):
+    r = math.sqrt((dx * dx + dy * dy) / 10.0)
+    t = int(r + 0.5)
+    return t + 1 if t < r else t
+
+def _att_array(dx, dy):
+    r = np.sqrt((dx * dx + dy * dy) / 10.0)
+    t = np.floor(r + 0.5)
+    return np.where(t < r, t + 1, t)
+
+METRICS = {
+    None: (math.hypot, np.hypot),
+    "EUC_2D": (lambda dx, dy: int(math.hypot(dx, dy) + 0.5), lambda dx, dy: np.floor(np.hypot(dx, dy) + 0.5)),
+    "CEIL_2D": (lambda dx, dy: math.ceil(math.hypot(dx, dy)), lambda dx, dy: np.ceil(np.hypot(dx, dy))),
+    "ATT": (_att, _att_array),
+}
+
+#coordinate instances up to this size get a float64 matrix,read by the scalar code (delta, cost) as a plain
+#list of lists (the fastest in Python); bigger ones compute every distance from the coordinates,
+#in cost/delta and in batch_cost alike,so both always agree
+LIST_LIMIT = 2000
+
+#distances[a][b] straight from the coordinates,for instances too big for a list of lists
+class LazyDistances:
+    def __init__(self, coords, metric):
+        self.xs = [x for x, y in coords]
+        self.ys = [y for x, y in coords]
+        self.metric = METRICS[metric][0]
+
+    def __getitem__(self, a):
+        return LazyRow(self, a)
+
+    def __len__(self):
+        return len(self.xs)
+
+class LazyRow:
+    __slots__ = ("table", "a")
+
+    def __init__(self, table, a):
+        self.table = table
+        self.a = a
+
+    def __getitem__(self, b):
+        t = self.table
+        return t.metric(t.xs[self.a] - t.xs[b], t.ys[self.a] - t.ys[b])
+
 class TSP:
+    #candidate lists: how many nearest cities each city looks at (neighborhood="candidates")
+    candidate_k = 8
+
     #constructor
-    def __init__(self, cities):
-        #cities: List of city names
+    #cities: List of city names
+    #coords: optional (x, y) per city,then the distances are real ones (metric = TSPLIB edge weight type)
+    #        instead of random integers
+    def __init__(self, cities, coords=None, metric=None):
         self.cities = cities
-        #A distance matrix between cities, generated randomly by _generate_distances()
-        self.distances = self._generate_distances()
+        self.metric = metric
+        self.coords = None if coords is None else np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        n = len(cities)
+        if self.coords is None:
+            #A distance matrix between cities, generated randomly by _generate_distances()
+            self.matrix = self._generate_distances()
+        elif n <= LIST_LIMIT:
+            self.matrix = self._coordinate_matrix()
+        else:
+            self.matrix = None
+        #scalar lookups distances[a][b] for cost/delta,the same numbers batch_cost uses
+        if self.matrix is not None and n <= LIST_LIMIT:
+            self.distances = self.matrix.tolist()
+        elif self.coords is not None:
+            self.distances = LazyDistances(self.coords.tolist(), metric)
+        else:
+            self.distances = self.matrix
+        #k -> candidate lists,see neighbor_lists
+        self._neighbors = {}
 
     def _generate_distances(self):
         #Number of cities.
         n = len(self.cities)
-        #2d list
-        distances = [[0]*n for _ in range(n)]
-        for i in range(n):
-            for j in range(i+1, n):
-                d = random.randint(1, 50)
-                #distances[i][j] = distances[j][i] = d (because distance from A→B = B→A)
-                distances[i][j] = distances[j][i] = d
-        return distances
-
-    def random_state(self):
+        #random 1..50 above the diagonal,then mirrored (distance from A→B = B→A)
+        #seeded from the random module so random.seed() still fixes the instance
+        gen = np.random.default_rng(random.getrandbits(32))
+        upper = np.triu(gen.integers(1, 51, size=(n, n), dtype=np.int32), 1)
+        return upper + upper.T
+
+    def _coordinate_matrix(self):
+        #broadcasting (n,1) - (1,n) a block of rows at a time,so the float64 temporaries stay small
+        n = len(self.coords)
+        xs, ys = self.coords[:, 0], self.coords[:, 1]
+        vector = METRICS[self.metric][1]
+        matrix = np.empty((n, n), dtype=np.float64)
+        block = 1024
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            matrix[start:stop] = vector(xs[start:stop, None] - xs[None, :], ys[start:stop, None] - ys[None, :])
+        return matrix
+
+    #TSPLIB file with a NODE_COORD_SECTION (EUC_2D, CEIL_2D or ATT)
+    @classmethod
+    def from_tsplib(cls, path):
+        spec = {}
+        coords = []
+        with open(path) as f:
+            lines = iter(f)
+            for line in lines:
+                line = line.strip()
+                if line.startswith("NODE_COORD_SECTION"):
+                    for line in lines:
+                        parts = line.split()
+                        if not parts or parts[0] == "EOF":
+                            break
+                        coords.append((float(parts[1]), float(parts[2])))
+                    break
+                if ":" in line:
+                    key, value = line.split(":", 1)
+                    spec[key.strip()] = value.strip()
+        metric = spec.get("EDGE_WEIGHT_TYPE", "EUC_2D")
+        if metric not in METRICS:
+            raise ValueError(f"unsupported EDGE_WEIGHT_TYPE: {metric}")
+        if "DIMENSION" in spec and int(spec["DIMENSION"]) != len(coords):
+            raise ValueError(f"DIMENSION is {spec['DIMENSION']} but {len(coords)} coordinates were read")
+        return cls([str(i + 1) for i in range(len(coords))], coords=coords, metric=metric)
+
+    #---- candidate lists ----
+    #the k nearest cities of every city,closest first,built once per instance
+    #matrix instances: argpartition over blocks of rows,huge coordinate instances: a grid (below)
+    def neighbor_lists(self, k=None):
+        n = len(self.cities)
+        k = min(self.candidate_k if k is None else k, n - 1)
+        if k not in self._neighbors:
+            if self.matrix is not None:
+                self._neighbors[k] = self._matrix_neighbors(k)
+            else:
+                self._neighbors[k] = self._grid_neighbors(k)
+        return self._neighbors[k]
+
+    def _matrix_neighbors(self, k):
+        n = len(self.cities)
+        lists = []
+        block = 1024
+        for start in range(0, n, block):
+            rows = self.matrix[start:start + block].astype(np.float64)
+            #a city is not its own neighbour
+            rows[np.arange(len(rows)), np.arange(start, start + len(rows))] = np.inf
+            nearest = np.argpartition(rows, k - 1, axis=1)[:, :k]
+            order = np.argsort(np.take_along_axis(rows, nearest, axis=1), axis=1)
+            lists.extend(np.take_along_axis(nearest, order, axis=1).tolist())
+        return lists
+
+    #about 2 cities per grid cell; the cities of one cell search the square of cells around it,
+    #growing the square until the k-th nearest is closer than anything outside it can be
+    def _grid_neighbors(self, k):
+        n = len(self.cities)
+        xy = self.coords
+        low = xy.min(axis=0)
+        g = max(1, int(math.sqrt(n / 2)))
+        width = max(float((xy.max(axis=0) - low).max()) / g, 1e-12)
+        cell = np.minimum(((xy - low) / width).astype(np.int64), g - 1)
+        cell_id = cell[:, 0] * g + cell[:, 1]
+        by_cell = np.argsort(cell_id, kind="stable")
+        #cities of cell c are by_cell[starts[c]:starts[c + 1]]
+        starts = np.searchsorted(cell_id[by_cell], np.arange(g * g + 1))
+        lists = [None] * n
+        for c in range(g * g):
+            members = by_cell[starts[c]:starts[c + 1]]
+            if len(members) == 0:
+                continue
+            cx, cy = divmod(c, g)
+            r = 1
+            while True:
+                x0, x1 = max(cx - r, 0), min(cx + r, g - 1)
+                y0, y1 = max(cy - r, 0), min(cy + r, g - 1)
+                #one contiguous slice of by_cell per grid row of the square
+                around = np.concatenate([by_cell[starts[x * g + y0]:starts[x * g + y1 + 1]] for x in range(x0, x1 + 1)])
+                whole = x0 == 0 and y0 == 0 and x1 == g - 1 and y1 == g - 1
+                if len(around) > k:
+                    diff = xy[members][:, None, :] - xy[around][None, :, :]
+                    dist = np.hypot(diff[..., 0], diff[..., 1])
+                    dist[members[:, None] == around[None, :]] = np.inf
+                    nearest = np.argpartition(dist, k - 1, axis=1)[:, :k]
+                    near_dist = np.take_along_axis(dist, nearest, axis=1)
+                    #anything outside the square is at least r cells away from every member
+                    if whole or near_dist.max() <= r * width:
+                        order = np.argsort(near_dist, axis=1)
+                        for m, row in zip(members.tolist(), np.take_along_axis(around[nearest], order, axis=1).tolist()):
+                            lists[m] = row
+                        break
+                r += 1
+        return lists
+
+    #2-opt over candidate lists with don't-look bits (Bentley):
+    #for city a and its tour neighbour b,only the k nearest cities c of a are tried as the new partner of a,
+    #and the scan stops as soon as d(a,c) >= d(a,b) because then no gain is possible any more.
+    #Cities whose neighbourhood did not change sit out (don't-look bit set) until a move touches them.
+    #The tour is an array + position table,a move reverses the shorter side -> no O(n^2) scan anywhere.
+    def climb_candidates(self, state, max_steps, stop=None):
+        d = self.distances
+        near = self.neighbor_lists()
+        n = len(state)
+        tour = list(state)
+        if n < 5:
+            return tour, self.cost(tour)
+        pos = [0] * n
+        for i, city in enumerate(tour):
+            pos[city] = i
+        #queue of cities whose don't-look bit is off
+        queue = deque(tour)
+        queued = [True] * n
+        steps = 0
+        while queue and steps < max_steps:
+            if stop is not None and steps % 64 == 0 and stop():
+                break
+            a = queue.popleft()
+            queued[a] = False
+            i = pos[a]
+            moved = None
+            for forward in (True, False):
+                b = tour[(i + 1) % n] if forward else tour[i - 1]
+                d_ab = d[a][b]
+                for c in near[a]:
+                    d_ac = d[a][c]
+                    if d_ac >= d_ab:
+                        break
+                    j = pos[c]
+                    e = tour[(j + 1) % n] if forward else tour[j - 1]
+                    if c == b or e == a:
+                        continue
+                    #replace (a,b),(c,e) with (a,c),(b,e)
+                    if d_ac + d[b][e] - d_ab - d[c][e] < -MIN_GAIN:
+                        moved = (b, c, e)
+                        #forward: reverse b..c, backward: reverse c..b
+                        if forward:
+                            self._reverse(tour, pos, (i + 1) % n, j)
+                        else:
+                            self._reverse(tour, pos, j, (i - 1) % n)
+                        break
+                if moved:
+                    break
+            if moved:
+                steps += 1
+                for city in (a,) + moved:
+                    if not queued[city]:
+                        queued[city] = True
+                        queue.append(city)
+        return tour, self.cost(tour)
+
+    #reverse tour positions i..j (going forward, wrapping around) in place;
+    #reversing the other side gives the same cycle,so always flip the shorter one
+    @staticmethod
+    def _reverse(tour, pos, i, j):
+        n = len(tour)
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+        for _ in range(length // 2):
+            a, b = tour[i], tour[j]
+            tour[i], tour[j] = b, a
+            pos[b], pos[a] = i, j
+            i = (i + 1) % n
+            j = (j - 1) % n
+
+    #rng: any random.Random-like object,the module itself by default
+    def random_state(self, rng=random):
         #Creates a random order of visiting cities (a permutation).
         state = list(range(len(self.cities)))
-        random.shuffle(state)
+        rng.shuffle(state)
         return state
 
     def cost(self, state):
-        total = 0
-        for i in range(len(state)):
-           #state[(i+1) % len(state)]: Wraps around so the last city connects back to the first (making it a cycle).
-            total += self.distances[state[i]][state[(i+1) % len(state)]]
+        d = self.distances
+        #the edge from the last city back to the first closes the cycle
+        total = d[state[-1]][state[0]]
+        for a, b in zip(state, state[1:]):
+            total += d[a][b]
         return total
+
+    #many tours at once: shape (m, n) -> m costs, one tour (n,) -> one cost
+    #each tour's edges are (tour[i], tour[i+1]) -> D[tour, np.roll(tour, -1)]
+    def batch_cost(self, tours):
+        tours = np.asarray(tours)
+        following = np.roll(tours, -1, axis=-1)
+        if self.matrix is not None:
+            total = np.int64 if self.matrix.dtype.kind == "i" else np.float64
+            return self.matrix[tours, following].sum(axis=-1, dtype=total)
+        #no matrix: same thing from the coordinates
+        a, b = self.coords[tours], self.coords[following]
+        vector = METRICS[self.metric][1]
+        return vector(a[..., 0] - b[..., 0], a[..., 1] - b[..., 1]).sum(axis=-1)
 #If state = [0, 2, 1], cost = dist[0][2] + dist[2][1] + dist[1][0].
 #If state = [0, 1, 2], neighbors are:
 #Swap(0,1) → [1, 0, 2]
@@ -81,6 +669,84 @@ class TSP:
 #Searching all possible routes directly is too expensive (factorial growth: n! possibilities).
 #So we use local search → explore only small modifications (neighbors).
 #Swapping gives us a structured way to explore different paths step by step.
+    #---- move API (see climb_moves) ----
+    #("2opt", i, j): reverse state[i+1..j] -> edges (a,b),(c,d) become (a,c),(b,d)
+    #("or", i, L, j): cut the segment state[i..i+L-1] (L = 1..3 cities) and put it back between state[j] and state[j+1]
+    def moves(self, state):
+        n = len(state)
+        for i in range(n - 1):
+            #i = 0 with j = n-1 would pick two edges that share a city
+            for j in range(i + 2, n if i > 0 else n - 1):
+                yield ("2opt", i, j)
+        for L in (1, 2, 3):
+            if n < L + 3:
+                break
+            for i in range(n - L + 1):
+                #everything except the edges touching the segment
+                blocked = {(i - 1) % n} | set(range(i, i + L))
+                for j in range(n):
+                    if j not in blocked:
+                        yield ("or", i, L, j)
+
+    def delta(self, state, move):
+        d = self.distances
+        n = len(state)
+        if move[0] == "2opt":
+            _, i, j = move
+            a, b, c, e = state[i], state[i+1], state[j], state[(j+1) % n]
+            return d[a][c] + d[b][e] - d[a][b] - d[c][e]
+        _, i, L, j = move
+        first, last = state[i], state[i+L-1]
+        before, after = state[i-1], state[(i+L) % n]
+        a, b = state[j], state[(j+1) % n]
+        #close the gap where the segment was, then open edge (a,b) to fit it in
+        return (d[before][after] - d[before][first] - d[last][after]
+                + d[a][first] + d[last][b] - d[a][b])
+
+    def apply(self, state, move):
+        if move[0] == "2opt":
+            _, i, j = move
+            return state[:i+1] + state[i+1:j+1][::-1] + state[j+1:]
+        _, i, L, j = move
+        segment = state[i:i+L]
+        rest = state[:i] + state[i+L:]
+        k = rest.index(state[j]) + 1
+        return rest[:k] + segment + rest[k:]
+
+    #one random 2-opt or Or-opt move (for the metaheuristics,which sample instead of scanning)
+    #None below 4 cities: every tour is the same cycle,moves() is empty too
+    def random_move(self, state, rng=random):
+        n = len(state)
+        if n < 4:
+            return None
+        if n >= 6 and rng.random() < 0.5:
+            L = rng.randint(1, 3)
+            i = rng.randrange(n - L + 1)
+            while True:
+                j = rng.randrange(n)
+                if j != (i - 1) % n and not i <= j < i + L:
+                    return ("or", i, L, j)
+        while True:
+            i = rng.randrange(n - 2)
+            j = rng.randrange(i + 2, n)
+            if i > 0 or j < n - 1:
+                return ("2opt", i, j)
+
+    #tabu attributes are edges: (edges the move adds, edges it removes)
+    def tabu_key(self, state, move):
+        n = len(state)
+        edge = lambda a, b: (a, b) if a < b else (b, a)
+        if move[0] == "2opt":
+            _, i, j = move
+            a, b, c, e = state[i], state[i+1], state[j], state[(j+1) % n]
+            return (edge(a, c), edge(b, e)), (edge(a, b), edge(c, e))
+        _, i, L, j = move
+        first, last = state[i], state[i+L-1]
+        before, after = state[i-1], state[(i+L) % n]
+        a, b = state[j], state[(j+1) % n]
+        return ((edge(before, after), edge(a, first), edge(last, b)),
+                (edge(before, first), edge(last, after), edge(a, b)))
+
     def get_neighbors(self, state):
         neighbors = []
         for i in range(len(state)):
@@ -94,8 +760,8 @@ class TSP:
 class EightQueens:
     #Creates a random board configuration.
 #Representation: a list of length 8 → state[col] = row.
-    def random_state(self):
-        return [random.randint(0, 7) for _ in range(8)]
+    def random_state(self, rng=random):
+        return [rng.randint(0, 7) for _ in range(8)]
 #Goal: Count number of attacking queen pairs.
 #Loop through all pairs of queens (i, j):
 #state[i] == state[j] → both in same row → conflict.
@@ -125,14 +791,181 @@ class EightQueens:
                     neighbors.append(neighbor)
         return neighbors
 
+# ---------------------- N Queens Problem ----------------------
+#Same idea as 8 queens (state[col] = row) for any n, but the board also keeps
+#how many queens sit on every row and both diagonals, so the cost and the change of any move are O(1).
+class QueensBoard:
+    __slots__ = ("rows", "row_count", "diag_down", "diag_up", "conflicts")
+
+    def __init__(self, rows):
+        n = len(rows)
+        self.rows = rows
+        self.row_count = [0] * n
+        #diag_down index = row - col + n - 1, diag_up index = row + col
+        self.diag_down = [0] * (2 * n - 1)
+        self.diag_up = [0] * (2 * n - 1)
+        #conflicts = attacking pairs,same number EightQueens.cost gives
+        self.conflicts = 0
+        for col, row in enumerate(rows):
+            self.conflicts += self.add(row, col)
+
+    #put a queen on (row, col),returns how many pairs it now attacks
+    def add(self, row, col):
+        d, u = row - col + len(self.rows) - 1, row + col
+        attacks = self.row_count[row] + self.diag_down[d] + self.diag_up[u]
+        self.row_count[row] += 1
+        self.diag_down[d] += 1
+        self.diag_up[u] += 1
+        return attacks
+
+    #take the queen off (row, col),returns how many pairs that removed
+    def remove(self, row, col):
+        d, u = row - col + len(self.rows) - 1, row + col
+        self.row_count[row] -= 1
+        self.diag_down[d] -= 1
+        self.diag_up[u] -= 1
+        return self.row_count[row] + self.diag_down[d] + self.diag_up[u]
+
+    def attacked(self, col):
+        row = self.rows[col]
+        return (self.row_count[row] + self.diag_down[row - col + len(self.rows) - 1]
+                + self.diag_up[row + col]) > 3
+
+class NQueens:
+    def __init__(self, n=8):
+        self.n = n
+
+    def random_state(self, rng=random):
+        return QueensBoard([rng.randrange(self.n) for _ in range(self.n)])
+
+    def cost(self, state):
+        return state.conflicts
+
+    #move (col, row): put the queen of column col on row
+    def moves(self, state):
+        for col in range(self.n):
+            current = state.rows[col]
+            for row in range(self.n):
+                if row != current:
+                    yield (col, row)
+
+    def delta(self, state, move):
+        col, row = move
+        old = state.rows[col]
+        n1 = self.n - 1
+        #pairs lost by leaving (old, col),every counter still includes the queen itself
+        lost = (state.row_count[old] + state.diag_down[old - col + n1] + state.diag_up[old + col]) - 3
+        #pairs gained on (row, col),old and new square never share a row or diagonal
+        gained = state.row_count[row] + state.diag_down[row - col + n1] + state.diag_up[row + col]
+        return gained - lost
+
+    def random_move(self, state, rng=random):
+        #one queen on a 1x1 board has nowhere to go
+        if self.n < 2:
+            return None
+        col = rng.randrange(self.n)
+        row = rng.randrange(self.n - 1)
+        #skip over the row the queen is on
+        if row >= state.rows[col]:
+            row += 1
+        return (col, row)
+
+    #moving a queen off (col, old row) makes going back there tabu
+    def tabu_key(self, state, move):
+        col, row = move
+        return ((col, row),), ((col, state.rows[col]),)
+
+    def apply(self, state, move):
+        col, row = move
+        state.conflicts -= state.remove(state.rows[col], col)
+        state.conflicts += state.add(row, col)
+        state.rows[col] = row
+        return state
+
+#Min-conflicts for big n (Sosic & Gu style):
+#1) greedy start: a random permutation (no two queens on a row) where every column first tries
+#   random free rows to find one with empty diagonals -> only a handful of conflicts are left
+#2) repair: take a random attacked queen and swap rows with random other columns until the swap helps.
+#Every step is O(1),so n = 1,000,000 is fine. Small boards can get stuck where no swap helps,
+#then we just start over from a new greedy permutation.
+def greedy_queens(n, rng=random, tries=100):
+    free = list(range(n))
+    rows = [0] * n
+    board = QueensBoard([])
+    board.rows = rows
+    board.row_count = [0] * n
+    board.diag_down = [0] * (2 * n - 1)
+    board.diag_up = [0] * (2 * n - 1)
+    for col in range(n):
+        #random free row,a few tries to find one on two empty diagonals
+        for attempt in range(tries):
+            k = rng.randrange(len(free))
+            row = free[k]
+            if board.diag_down[row - col + n - 1] == 0 and board.diag_up[row + col] == 0:
+                break
+        free[k] = free[-1]
+        free.pop()
+        rows[col] = row
+        board.conflicts += board.add(row, col)
+    return board
+
+def min_conflicts(problem, rng=random, max_steps=None, tries=100):
+    n = problem.n
+    if max_steps is None:
+        max_steps = 50 * n + 100000
+    #swaps without any improvement before we give up on this start
+    stall_limit = 20 * n + 100
+    steps = 0
+    best = None
+    while True:
+        board = greedy_queens(n, rng, tries)
+        rows = board.rows
+        attacked = [col for col in range(n) if board.attacked(col)]
+        stall = 0
+        while board.conflicts > 0 and steps < max_steps and stall < stall_limit:
+            k = rng.randrange(len(attacked))
+            i = attacked[k]
+            if not board.attacked(i):
+                attacked[k] = attacked[-1]
+                attacked.pop()
+                continue
+            steps += 1
+            stall += 1
+            j = rng.randrange(n)
+            if j == i:
+                continue
+            ri, rj = rows[i], rows[j]
+            #cheap filter first: the square queen i would land on must have both diagonals empty
+            if board.diag_down[rj - i + n - 1] or board.diag_up[rj + i]:
+                continue
+            #swap: take both queens off and put them back on each other's rows
+            change = -board.remove(ri, i) - board.remove(rj, j)
+            change += board.add(rj, i) + board.add(ri, j)
+            if change < 0:
+                rows[i], rows[j] = rj, ri
+                board.conflicts += change
+                stall = 0
+                if board.attacked(j):
+                    attacked.append(j)
+            else:
+                #undo
+                board.remove(rj, i)
+                board.remove(ri, j)
+                board.add(ri, i)
+                board.add(rj, j)
+        if best is None or board.conflicts < best.conflicts:
+            best = board
+        if best.conflicts == 0 or steps >= max_steps:
+            return best, best.conflicts
+
 # ---------------------- 8 Puzzle Problem ----------------------
 class EightPuzzle:
     goal_state = [[1,2,3],[4,5,6],[7,8,0]]
    
-    def random_state(self):
+    def random_state(self, rng=random):
         state = [i for i in range(9)]
         #to generate a new arrangement.
-        random.shuffle(state)
+        rng.shuffle(state)
         #Convert the 1-D shuffled list into a 3x3 matrix.
         return [state[0:3], state[3:6], state[6:9]]
 
@@ -177,6 +1010,36 @@ def main():
     t2 = time.time()
     results.append(["TSP", cost, f"{(t2 - t1)*1000:.3f} ms"])
 
+    # Bigger TSP: 2-opt / Or-opt moves with O(1) cost deltas
+    problem = TSP([f"C{i}" for i in range(100)])
+    t7 = time.time()
+    solution, cost = random_restart_hill_climb(problem, restarts=3, max_steps=10000, strategy="first")
+    t8 = time.time()
+    results.append(["TSP-100 (2-opt/Or-opt)", cost, f"{(t8 - t7)*1000:.3f} ms"])
+
+    # TSP from coordinates (EUC_2D like TSPLIB),1000 random tours costed in one numpy call
+    coords = [(random.uniform(0, 1000), random.uniform(0, 1000)) for _ in range(1000)]
+    big = TSP([f"C{i}" for i in range(1000)], coords=coords, metric="EUC_2D")
+    tours = np.array([big.random_state() for _ in range(1000)])
+    t15 = time.time()
+    costs = big.batch_cost(tours)
+    t16 = time.time()
+    results.append(["TSP-1000 coords (batch of 1000 tours)", int(costs.min()), f"{(t16 - t15)*1000:.3f} ms"])
+
+    # Same 1000 cities climbed with 2-opt over the 8 nearest cities + don't-look bits
+    t17 = time.time()
+    solution, cost = random_restart_hill_climb(big, restarts=3, max_steps=10**6, neighborhood="candidates")
+    t18 = time.time()
+    results.append(["TSP-1000 (candidate lists)", int(cost), f"{(t18 - t17)*1000:.3f} ms"])
+
+    # Same TSP-100,1 s each for the metaheuristics
+    for name, engine in [("annealing", simulated_annealing), ("tabu", tabu_search),
+                         ("late acceptance", late_acceptance)]:
+        t13 = time.time()
+        solution, cost = engine(problem, max_evals=None, time_limit=1.0, seed=1)
+        t14 = time.time()
+        results.append([f"TSP-100 ({name})", cost, f"{(t14 - t13)*1000:.3f} ms"])
+
     # 8 Queens Problem
     problem = EightQueens()
     t3 = time.time()
@@ -184,6 +1047,19 @@ def main():
     t4 = time.time()
     results.append(["8-Queens", cost, f"{(t4 - t3)*1000:.3f} ms"])
 
+    # 8 Queens,restarts spread over 4 processes,stop at the first 0-conflict board
+    t9 = time.time()
+    solution, cost = random_restart_hill_climb(problem, restarts=200, max_steps=500, seed=1, workers=4, target=0)
+    t10 = time.time()
+    results.append(["8-Queens (4 workers)", cost, f"{(t10 - t9)*1000:.3f} ms"])
+
+    # N Queens with min-conflicts,incremental counters keep every step O(1)
+    problem = NQueens(100000)
+    t11 = time.time()
+    solution, cost = min_conflicts(problem, rng=random.Random(1))
+    t12 = time.time()
+    results.append(["100000-Queens (min-conflicts)", cost, f"{(t12 - t11)*1000:.3f} ms"])
+
     # 8 Puzzle Problem
     problem = EightPuzzle()
     t5 = time.time()
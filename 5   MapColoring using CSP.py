@@ -4,10 +4,15 @@
 #Each country is a node, borders are edges. Planar property ensures that 4 colors are enough to color any map (the Four Color Theorem).
 import time
 import tracemalloc
-import sys
-
-# Increase recursion limit,generally does upto 100
-sys.setrecursionlimit(50000)
+import random
+import operator
+#the propagation queue
+from collections import deque
+#DSATUR saturation heap
+import heapq
+#decomposed maps: independent pieces in a process pool
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 
 # ---------------- Graph Generator ----------------
 def generate_planar_graph(rows=10, cols=10):
@@ -66,66 +71,567 @@ def generate_planar_graph(rows=10, cols=10):
 
     return adjacency
 
+# ---------------- CSP state: bitmask domains + trail ----------------
+#Nodes are renumbered 0..n-1 so everything is a list lookup.
+#domain[i] is an int bitmask: bit c set -> color c is still possible for node i.
+#Every change pushes (node, old mask) on the trail; going back is just popping to a saved mark,
+#so no domain is ever copied.
+#Forward checking: after node i gets color c,remove c from every neighbour (empty domain -> dead end).
+#MAC: keep going like AC-3. For != constraints an arc (u, v) can only lose a value when v has a
+#single color left,so the arc queue is just the nodes that became singletons.
+#propagation=None: no pruning at all,a color is only checked against the neighbours colored so far.
+#
+#MRV without scanning: unassigned nodes sit in buckets[colors left][degree],
+#so the next node (fewest colors,ties -> most neighbours) is found by looking at a few small buckets.
+#adjacency dict -> (node list, neighbour lists by position)
+def index_graph(graph):
+    nodes = list(graph)
+    index = {v: i for i, v in enumerate(nodes)}
+    return nodes, [[index[u] for u in graph[v]] for v in nodes]
+
+class ColoringState:
+    def __init__(self, graph, colors):
+        self.nodes, self.neighbors = index_graph(graph)
+        n = len(self.nodes)
+        self.degree = [len(nb) for nb in self.neighbors]
+        self.domain = [(1 << colors) - 1] * n
+        self.assigned = [False] * n
+        self.unassigned = n
+        self.trail = []
+        #colors tried so far (search nodes)
+        self.steps = 0
+        #buckets[size] = {degree: set of unassigned nodes}
+        self.buckets = [{} for _ in range(colors + 1)]
+        for i in range(n):
+            self.bucket_add(i, colors)
+
+    def bucket_add(self, i, size):
+        self.buckets[size].setdefault(self.degree[i], set()).add(i)
+
+    def bucket_remove(self, i, size):
+        by_degree = self.buckets[size]
+        nodes = by_degree[self.degree[i]]
+        nodes.discard(i)
+        if not nodes:
+            del by_degree[self.degree[i]]
+
+    def set_domain(self, i, mask):
+        if not self.assigned[i]:
+            self.bucket_remove(i, self.domain[i].bit_count())
+            self.bucket_add(i, mask.bit_count())
+        self.domain[i] = mask
+
+    def prune(self, i, mask):
+        self.trail.append((i, self.domain[i]))
+        self.set_domain(i, mask)
+
+    #unassigned node with the fewest colors left,ties -> most neighbours
+    def select(self):
+        for by_degree in self.buckets:
+            if by_degree:
+                nodes = by_degree[max(by_degree)]
+                #pop + add instead of next(iter()): iterating a set that had many removals
+                #rescans the dead slots every time,pop remembers where it stopped
+                i = nodes.pop()
+                nodes.add(i)
+                return i
+        return None
+
+    #color node i with the single-bit mask `bit`,then propagate; False = dead end
+    def assign(self, i, bit, propagation="mac"):
+        self.steps += 1
+        self.bucket_remove(i, self.domain[i].bit_count())
+        self.trail.append((i, None))
+        self.assigned[i] = True
+        self.unassigned -= 1
+        if self.domain[i] != bit:
+            self.trail.append((i, self.domain[i]))
+            self.domain[i] = bit
+        if propagation is None:
+            #nothing was pruned,so just look at the neighbours that already have a color
+            for u in self.neighbors[i]:
+                if self.assigned[u] and self.domain[u] == bit:
+                    return False
+            return True
+        mac = propagation == "mac"
+        queue = deque([i])
+        while queue:
+            v = queue.popleft()
+            bit = self.domain[v]
+            for u in self.neighbors[v]:
+                if self.domain[u] & bit:
+                    mask = self.domain[u] & ~bit
+                    if mask == 0:
+                        return False
+                    self.prune(u, mask)
+                    #only MAC carries on from nodes that are down to one color
+                    if mac and mask & (mask - 1) == 0:
+                        queue.append(u)
+        return True
+
+    def undo(self, mark):
+        trail = self.trail
+        while len(trail) > mark:
+            i, old = trail.pop()
+            if old is None:
+                self.assigned[i] = False
+                self.unassigned += 1
+                self.bucket_add(i, self.domain[i].bit_count())
+            else:
+                self.set_domain(i, old)
+
+    def solution(self):
+        return {v: self.domain[i].bit_length() - 1 for i, v in enumerate(self.nodes)}
+
 # ---------------- CSP Backtracking ----------------
-def is_consistent(node, color, assignment, graph):
-    #Check if assigning 'color' to 'node' is valid wrt neighbors.
-    for neighbor in graph[node]:
-        if neighbor in assignment and assignment[neighbor] == color:
-            return False
-    return True
-#assignment → dictionary storing nodes with assigned colors.
-#variables → list of all nodes.
-#domains → possible colors for each node.
-#graph → adjacency list.
-#start + timeout → to stop if it takes too long.
-#timeout → is the maximum time allowed (in seconds).
-def backtrack(assignment, variables, domains, graph, start, timeout=10):
-    """Recursive backtracking search with MRV + timeout."""
-    #If all nodes are assigned → we found a valid solution.
-    if len(assignment) == len(variables):
-        return assignment
-
-    #If it runs longer than timeout seconds → abort search.
-    if time.time() - start > timeout:
+#No recursion: the stack holds one choice point per colored node,
+#[node, colors not tried yet, trail mark before the node was colored].
+#Coming back to a choice point undoes everything after its mark and tries the next color;
+#out of colors -> pop it and the one below tries its next color.
+#start + timeout → stop if it takes too long (timeout is the maximum time allowed in seconds).
+#returns True (solved), False (no coloring exists) or None (timeout)
+def backtrack(state, start, timeout=10, propagation="mac"):
+    if state.unassigned == 0:
+        return True
+    i = state.select()
+    stack = [[i, state.domain[i], len(state.trail)]]
+    while stack:
+        #If it runs longer than timeout seconds → abort search (checked every 256 steps).
+        if state.steps & 255 == 0 and time.time() - start > timeout:
+            return None
+        frame = stack[-1]
+        i, colors, mark = frame
+        state.undo(mark)
+        if colors == 0:
+            stack.pop()
+            continue
+        #lowest color first
+        bit = colors & -colors
+        frame[1] = colors ^ bit
+        if state.assign(i, bit, propagation):
+            if state.unassigned == 0:
+                return True
+            j = state.select()
+            stack.append([j, state.domain[j], len(state.trail)])
+    return False
+
+# ---------------- DSATUR greedy coloring ----------------
+#Color one node at a time,always the one whose neighbours already use the most different colors
+#(saturation),ties -> most neighbours,and give it the lowest color none of them uses.
+#Never backtracks,so it may need more colors than asked for; returns a color per position.
+#saturation heap: (-saturation, -degree, node) entries,stale ones are skipped when popped
+def dsatur(nodes, neighbors):
+    n = len(nodes)
+    color = [-1] * n
+    #bitmask of the colors around each node
+    around = [0] * n
+    heap = [(0, -len(neighbors[i]), i) for i in range(n)]
+    heapq.heapify(heap)
+    while heap:
+        saturation, degree, i = heapq.heappop(heap)
+        if color[i] != -1 or -saturation != around[i].bit_count():
+            continue
+        #lowest color missing from the mask
+        mask = around[i]
+        c = (~mask & (mask + 1)).bit_length() - 1
+        color[i] = c
+        bit = 1 << c
+        for u in neighbors[i]:
+            if color[u] == -1 and not around[u] & bit:
+                around[u] |= bit
+                heapq.heappush(heap, (-around[u].bit_count(), -len(neighbors[u]), u))
+    return color
+
+# ---------------- Min-conflicts with tabu ----------------
+#Repairs a coloring that uses colors >= `colors` (e.g. from DSATUR): those nodes get their least
+#conflicting allowed color,then a random conflicted node is moved to the color with the fewest
+#same-colored neighbours. Moving node v off color c makes (v, c) tabu for a random 1..tenure steps
+#(a fixed tenure cycles far more often),unless taking it would give fewer conflicts than the best
+#seen so far (aspiration). Runs until no conflicts are left,the timeout or max_steps.
+#returns (color list, conflicts left)
+def min_conflicts_coloring(neighbors, color, colors, start, timeout=10, max_steps=None, tenure=5, rng=random):
+    n = len(color)
+    color = list(color)
+
+    #how many neighbours share each color,for node v
+    def counts(v):
+        same = [0] * colors
+        for u in neighbors[v]:
+            if 0 <= color[u] < colors:
+                same[color[u]] += 1
+        return same
+
+    #first put every out-of-range node on its least conflicting color
+    for v in range(n):
+        if color[v] >= colors:
+            same = counts(v)
+            color[v] = same.index(min(same))
+    conflicts = [sum(1 for u in neighbors[v] if color[u] == color[v]) for v in range(n)]
+    total = sum(conflicts) // 2
+    best = total
+    #conflicted nodes,stale entries are dropped when drawn
+    bad = [v for v in range(n) if conflicts[v]]
+    in_bad = [c > 0 for c in conflicts]
+    tabu = {}
+    step = 0
+    while max_steps is None or step < max_steps:
+        step += 1
+        if total == 0 or not bad:
+            break
+        if step & 255 == 0 and time.time() - start > timeout:
+            break
+        k = rng.randrange(len(bad))
+        v = bad[k]
+        if conflicts[v] == 0:
+            bad[k] = bad[-1]
+            bad.pop()
+            in_bad[v] = False
+            continue
+        same = counts(v)
+        old = color[v]
+        choice, choice_count = None, None
+        for c in range(colors):
+            if c == old:
+                continue
+            allowed = tabu.get((v, c), -1) < step or total - same[old] + same[c] < best
+            if allowed and (choice is None or same[c] < choice_count
+                            or (same[c] == choice_count and rng.random() < 0.5)):
+                choice, choice_count = c, same[c]
+        if choice is None:
+            continue
+        tabu[(v, old)] = step + 1 + rng.randrange(tenure)
+        color[v] = choice
+        total += same[choice] - same[old]
+        best = min(best, total)
+        conflicts[v] = same[choice]
+        for u in neighbors[v]:
+            if color[u] == old:
+                conflicts[u] -= 1
+            elif color[u] == choice:
+                conflicts[u] += 1
+                if not in_bad[u]:
+                    in_bad[u] = True
+                    bad.append(u)
+    return color, total
+
+# ---------------- Generic binary CSP: conflict-directed backjumping ----------------
+#Any variables/domains and any binary constraints,not only != between neighbours.
+#add_constraint(x, y, relation): relation(value of x, value of y) -> True if the pair is allowed.
+class BinaryCSP:
+    def __init__(self, domains):
+        self.variables = list(domains)
+        self.domains = {v: list(values) for v, values in domains.items()}
+        #v -> {u: relation(value of v, value of u)}
+        self.constraints = {v: {} for v in self.variables}
+
+    def add_constraint(self, x, y, relation):
+        #two constraints on the same pair have to hold together
+        old_xy = self.constraints[x].get(y)
+        if old_xy is None:
+            self.constraints[x][y] = relation
+            self.constraints[y][x] = lambda b, a: relation(a, b)
+        else:
+            old_yx = self.constraints[y][x]
+            self.constraints[x][y] = lambda a, b: old_xy(a, b) and relation(a, b)
+            self.constraints[y][x] = lambda b, a: old_yx(b, a) and relation(a, b)
+
+    #map coloring as a BinaryCSP: neighbours must differ
+    @classmethod
+    def coloring(cls, graph, colors):
+        csp = cls({v: range(colors) for v in graph})
+        for v in graph:
+            for u in graph[v]:
+                csp.constraints[v][u] = operator.ne
+        return csp
+
+#static order: start at the most constrained variable,then always the one with the most neighbours
+#already ordered (ties -> most neighbours),so every variable is checked against its neighbours early
+def cbj_order(csp):
+    ordered = {}
+    linked = {v: 0 for v in csp.variables}
+    degree = {v: len(csp.constraints[v]) for v in csp.variables}
+    heap = [(0, -degree[v], i, v) for i, v in enumerate(csp.variables)]
+    heapq.heapify(heap)
+    while heap:
+        count, d, i, v = heapq.heappop(heap)
+        if v in ordered or -count != linked[v]:
+            continue
+        ordered[v] = len(ordered)
+        for u in csp.constraints[v]:
+            if u not in ordered:
+                linked[u] += 1
+                heapq.heappush(heap, (-linked[u], -degree[u], i, u))
+    return list(ordered)
+
+#Prosser's CBJ: every depth keeps a conflict set,the earlier depths whose values ruled out one of its values.
+#When a variable runs out of values we jump straight back to the deepest depth in its conflict set
+#(not just one level up) and hand the rest of the set to it; everything in between keeps nothing.
+#Nogoods: such a dead end also proves that the values at the conflict-set depths can never appear together,
+#those combinations (at most max_nogood_size pairs,the nogood_limit newest ones) are kept and checked on
+#every later assignment. nogood_limit=0 switches learning off.
+#returns (solution dict or None, stats); stats["status"] is "solved", "unsatisfiable" or "timeout"
+def cbj_solve(csp, timeout=10, nogood_limit=1000, max_nogood_size=4):
+    start = time.time()
+    order = cbj_order(csp)
+    n = len(order)
+    depth_of = {v: i for i, v in enumerate(order)}
+    #constraints towards earlier depths only: (earlier depth, relation(value here, value there))
+    earlier = [[(depth_of[u], rel) for u, rel in csp.constraints[v].items() if depth_of[u] < i]
+               for i, v in enumerate(order)]
+    values = [None] * n
+    #untried values per depth,tried from the end (so reversed once)
+    remaining = [None] * n
+    conflict = [set() for _ in range(n)]
+    #nogoods: id -> ((depth, value), ...) sorted by depth,indexed by their deepest pair only:
+    #that is the assignment that completes them,all the other depths are already set at that point
+    #(the order is static,so depths stay meaningful)
+    nogoods = {}
+    by_pair = {}
+    next_id = 0
+    stats = {"status": "solved", "nodes": 0, "backjumps": 0, "levels_skipped": 0,
+             "nogoods_learned": 0, "nogood_prunes": 0}
+    if n == 0:
+        return {}, stats
+    remaining[0] = csp.domains[order[0]][::-1]
+    i = 0
+    while i < n:
+        if stats["nodes"] & 255 == 0 and time.time() - start > timeout:
+            stats["status"] = "timeout"
+            return None, stats
+        found = False
+        while remaining[i]:
+            a = remaining[i].pop()
+            stats["nodes"] += 1
+            ok = True
+            for h, rel in earlier[i]:
+                if not rel(a, values[h]):
+                    conflict[i].add(h)
+                    ok = False
+                    break
+            if ok and (i, a) in by_pair:
+                for nid in by_pair[(i, a)]:
+                    rest = nogoods[nid][:-1]
+                    if all(values[h] == b for h, b in rest):
+                        conflict[i].update(h for h, b in rest)
+                        stats["nogood_prunes"] += 1
+                        ok = False
+                        break
+            if ok:
+                values[i] = a
+                found = True
+                break
+        if found:
+            i += 1
+            if i < n:
+                remaining[i] = csp.domains[order[i]][::-1]
+                conflict[i] = set()
+            continue
+        #dead end at depth i
+        if not conflict[i]:
+            stats["status"] = "unsatisfiable"
+            return None, stats
+        h = max(conflict[i])
+        if nogood_limit and len(conflict[i]) <= max_nogood_size:
+            pairs = tuple((d, values[d]) for d in sorted(conflict[i]))
+            nogoods[next_id] = pairs
+            by_pair.setdefault(pairs[-1], []).append(next_id)
+            next_id += 1
+            stats["nogoods_learned"] += 1
+            #forget the oldest one (dicts keep insertion order)
+            if len(nogoods) > nogood_limit:
+                oldest = next(iter(nogoods))
+                last = nogoods.pop(oldest)[-1]
+                by_pair[last].remove(oldest)
+                if not by_pair[last]:
+                    del by_pair[last]
+        conflict[h] |= conflict[i]
+        conflict[h].discard(h)
+        stats["backjumps"] += 1
+        stats["levels_skipped"] += i - h - 1
+        for j in range(h + 1, i + 1):
+            conflict[j] = set()
+        values[h] = None
+        i = h
+    return {v: values[i] for i, v in enumerate(order)}, stats
+
+# ---------------- Decomposition ----------------
+#Kempe: a vertex with fewer than k neighbours can always be colored after them,some color is left over.
+#Peel such vertices off until none are left (removing one lowers its neighbours' degrees too),
+#color the rest (the core) and then the peeled ones in reverse order.
+#Trees and forests peel away completely for k >= 2,so they are colored in linear time without any search.
+#returns (core set, peeled vertices in removal order)
+def peel_low_degree(graph, k):
+    degree = {v: len(graph[v]) for v in graph}
+    queue = deque(v for v in graph if degree[v] < k)
+    peeled = []
+    removed = set(queue)
+    while queue:
+        v = queue.popleft()
+        peeled.append(v)
+        for u in graph[v]:
+            if u not in removed:
+                degree[u] -= 1
+                if degree[u] < k:
+                    removed.add(u)
+                    queue.append(u)
+    return set(graph) - removed, peeled
+
+#Hopcroft-Tarjan on an explicit stack: every connected component splits into biconnected blocks that
+#only share cut vertices. returns [(head, vertices)], head = the block's vertex closest to the DFS root.
+#Blocks come out children first,so in reversed order every block after the first of its component
+#meets the already listed blocks in exactly one vertex: its head.
+def biconnected_blocks(graph):
+    disc, low = {}, {}
+    blocks = []
+    for root in graph:
+        if root in disc:
+            continue
+        disc[root] = low[root] = len(disc)
+        if not graph[root]:
+            blocks.append((root, [root]))
+            continue
+        edges = []
+        stack = [(root, None, iter(graph[root]))]
+        while stack:
+            v, parent, it = stack[-1]
+            child = None
+            for u in it:
+                if u == parent:
+                    continue
+                if u not in disc:
+                    child = u
+                    break
+                #back edge (the tree edge towards an already visited descendant was stacked from its side)
+                if disc[u] < disc[v]:
+                    low[v] = min(low[v], disc[u])
+                    edges.append((v, u))
+            if child is not None:
+                disc[child] = low[child] = len(disc)
+                edges.append((v, child))
+                stack.append((child, v, iter(graph[child])))
+                continue
+            stack.pop()
+            if parent is None:
+                continue
+            low[parent] = min(low[parent], low[v])
+            #nothing below v reaches above parent -> the edges stacked since (parent, v) form one block
+            if low[v] >= disc[parent]:
+                block = set()
+                while True:
+                    edge = edges.pop()
+                    block.update(edge)
+                    if edge == (parent, v):
+                        break
+                blocks.append((parent, sorted(block, key=disc.get)))
+    return blocks
+
+#peel,split the core into blocks,solve every block on its own and glue them back together:
+#two blocks only share a cut vertex,so swapping two colors inside a block makes it agree with the
+#color its head already got. Blocks of 1-2 vertices are colored directly.
+#workers > 1: the blocks that need a search run in a process pool
+def solve_decomposed(graph, colors, timeout, propagation, strategy, rng, workers):
+    start = time.time()
+    #work on 0..n-1 (cheap to hash and to send to the pool),the real names come back at the end
+    nodes, neighbors = index_graph(graph)
+    graph = dict(enumerate(neighbors))
+    core, peeled = peel_low_degree(graph, colors)
+    blocks = biconnected_blocks({v: [u for u in graph[v] if u in core] for v in core})
+    blocks.reverse()
+    pieces = [block for head, block in blocks if len(block) > 2]
+    #own generator per piece,so the pool and the serial loop give the same coloring
+    seeds = [rng.getrandbits(32) for _ in pieces]
+    graphs = []
+    for block in pieces:
+        inside = set(block)
+        graphs.append({v: [u for u in graph[v] if u in inside] for v in block})
+    if workers is not None and workers > 1 and len(pieces) > 1:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            jobs = [pool.submit(solve_map_coloring, g, colors, timeout - (time.time() - start), propagation,
+                                strategy, random.Random(seed)) for g, seed in zip(graphs, seeds)]
+            solved = [job.result() for job in jobs]
+    else:
+        solved = []
+        for g, seed in zip(graphs, seeds):
+            left = timeout - (time.time() - start)
+            solution = solve_map_coloring(g, colors, left, propagation, strategy, random.Random(seed)) if left > 0 else None
+            if solution is None:
+                return None
+            solved.append(solution)
+    if any(solution is None for solution in solved):
         return None
-    # MRV heuristic: pick variable with fewest remaining colors
-    unassigned = [v for v in variables if v not in assignment]
-    node = min(unassigned, key=lambda var: len(domains[var]))
-
-    for color in domains[node]:
-        if is_consistent(node, color, assignment, graph):
-            assignment[node] = color
-            result = backtrack(assignment, variables, domains, graph, start, timeout)
-            if result is not None:
-                return result
-            del assignment[node]  # backtrack
+    solved.reverse()
+    color = {}
+    for head, block in blocks:
+        if len(block) > 2:
+            part = solved.pop()
+        elif len(block) <= colors:
+            part = dict(zip(block, range(len(block))))
+        else:
+            return None
+        if head in color and part[head] != color[head]:
+            a, b = part[head], color[head]
+            part = {v: b if c == a else a if c == b else c for v, c in part.items()}
+        color.update(part)
+    for v in reversed(peeled):
+        used = {color[u] for u in graph[v] if u in color}
+        color[v] = next(c for c in range(colors) if c not in used)
+    return {nodes[i]: c for i, c in color.items()}
 
-    return None
 #--------solver--------
-def solve_map_coloring(graph, colors=4, timeout=10):
-    variables = list(graph.keys())
-    domains = {v: list(range(colors)) for v in variables}
-    assignment = {}
+#strategy: "backtracking" (complete search),
+#          "dsatur" (greedy,fails if it needs more than `colors` colors),
+#          "min-conflicts" (DSATUR,then min-conflicts/tabu repair if it needed too many colors),
+#          "cbj" (complete search with conflict-directed backjumping + nogoods,see cbj_solve)
+#propagation (backtracking only): "mac" (default), "fc" (forward checking only) or None (plain backtracking)
+#decompose: peel/split the map first and only search the blocks that are left (see solve_decomposed),
+#workers > 1 solves those blocks in parallel
+def solve_map_coloring(graph, colors=4, timeout=10, propagation="mac", strategy="backtracking", rng=random,
+                       decompose=False, workers=None):
+    if decompose:
+        return solve_decomposed(graph, colors, timeout, propagation, strategy, rng, workers)
     start = time.time()#current time in sec
-    return backtrack(assignment, variables, domains, graph, start, timeout)
+    if strategy in ("dsatur", "min-conflicts"):
+        nodes, neighbors = index_graph(graph)
+        color = dsatur(nodes, neighbors)
+        if strategy == "min-conflicts" and any(c >= colors for c in color):
+            color, left = min_conflicts_coloring(neighbors, color, colors, start, timeout, rng=rng)
+            if left:
+                return None
+        if any(c >= colors for c in color):
+            return None
+        return dict(zip(nodes, color))
+    if strategy == "cbj":
+        solution, stats = cbj_solve(BinaryCSP.coloring(graph, colors), timeout)
+        return solution
+    if strategy != "backtracking":
+        raise ValueError(f"unknown strategy: {strategy}")
+    if propagation not in ("fc", "mac", None):
+        raise ValueError(f"unknown propagation: {propagation}")
+    state = ColoringState(graph, colors)
+    if backtrack(state, start, timeout, propagation):
+        return state.solution()
+    return None
 
 # ---------------- Benchmark Function ----------------
-def benchmark(rows, cols, colors=4, timeout=10):
+def benchmark(rows, cols, colors=4, timeout=10, propagation="mac", strategy="backtracking", decompose=False):
     graph = generate_planar_graph(rows, cols)
     n = len(graph)
 
-    print(f"\nRunning CSP-Backtracking Map Coloring on graph with {n} nodes")
+    print(f"\nRunning CSP Map Coloring ({strategy}) on graph with {n} nodes")
 
     tracemalloc.start()
     start = time.time()
 
-    solution = solve_map_coloring(graph, colors, timeout)
+    solution = solve_map_coloring(graph, colors, timeout, propagation, strategy, decompose=decompose)
 
     end = time.time()
     current, peak = tracemalloc.get_traced_memory()
     tracemalloc.stop()
 
     return {
+        "Strategy": strategy + (" (dec.)" if decompose else ""),
         "Nodes": n,
         #graph is your adjacency list (dict: node → set of neighbors)For each node, len(v) = number of neighbors (degree of that node).So sum(len(v) for v in graph.values()) = sum of all degrees in the graph.Handshaking Lemma 🖐️Sum of degrees of all vertices=2×Number of edgesAdjacency list:
 #{
@@ -142,15 +648,23 @@ def benchmark(rows, cols, colors=4, timeout=10):
         "Success": solution is not None#did we solve it or not(just a boolean flag to record whether the backtracking search actually found a solution.)
     }
 
-# ---------------- Run Experiments ----------------
-results = []
-results.append(benchmark(10, 10, timeout=10))     # ~100 nodes
-results.append(benchmark(32, 32, timeout=15))     # ~1000 nodes
-results.append(benchmark(100, 100, timeout=20))   # ~10000 nodes (may timeout)
-
-# ---------------- Tabulate Results ----------------
-print("\nResults:")
-print(f"{'Nodes':>10} | {'Edges':>10} | {'Time (s)':>10} | {'Memory (KB)':>12} | {'Success':>8}")
-print("-"*60)
-for row in results:
-    print(f"{row['Nodes']:>10} | {row['Edges']:>10} | {row['Time (s)']:>10} | {row['Memory (KB)']:>12} | {row['Success']}")
+if __name__ == "__main__":
+    # ---------------- Run Experiments ----------------
+    results = []
+    results.append(benchmark(10, 10, timeout=10))     # ~100 nodes
+    results.append(benchmark(32, 32, timeout=15))     # ~1000 nodes
+    results.append(benchmark(100, 100, timeout=20))   # ~10000 nodes
+    #big maps: greedy DSATUR,and min-conflicts repairing it down to 3 colors
+    results.append(benchmark(316, 316, strategy="dsatur"))            # ~100000 nodes
+    results.append(benchmark(316, 316, colors=3, strategy="min-conflicts"))
+    #3 colors with plain checks only: chronological backtracking thrashes here,backjumping doesn't
+    results.append(benchmark(100, 100, colors=3, strategy="cbj", timeout=20))
+    #with 4 colors these maps peel away completely (Kempe),no search at all
+    results.append(benchmark(316, 316, decompose=True))
+
+    # ---------------- Tabulate Results ----------------
+    print("\nResults:")
+    print(f"{'Strategy':<20} | {'Nodes':>10} | {'Edges':>10} | {'Time (s)':>10} | {'Memory (KB)':>12} | {'Success':>8}")
+    print("-"*83)
+    for row in results:
+        print(f"{row['Strategy']:<20} | {row['Nodes']:>10} | {row['Edges']:>10} | {row['Time (s)']:>10} | {row['Memory (KB)']:>12} | {row['Success']}")
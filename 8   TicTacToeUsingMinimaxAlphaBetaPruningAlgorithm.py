@@ -199,50 +199,51 @@ def play_game(use_alpha_beta=True):
     else:
         print("Game Draw (-1)")
 
-# ------------------ Run and Compare ------------------
-print("===== Minimax vs Alpha-Beta Comparison =====")
-minimax_nodes = 0
-ab_nodes = 0
-
-# Minimax Test
-print("\nPlaying with Minimax:")
-start_time = time.time()
-play_game(use_alpha_beta=False)
-minimax_time = time.time() - start_time
-print(f"Nodes visited (Minimax): {minimax_nodes}")
-print(f"Execution time (Minimax): {minimax_time:.4f} sec")
-
-# Alpha-Beta Test
-print("\nPlaying with Alpha-Beta Pruning:")
-start_time = time.time()
-play_game(use_alpha_beta=True)
-ab_time = time.time() - start_time
-print(f"Nodes visited (Alpha-Beta): {ab_nodes}")
-print(f"Execution time (Alpha-Beta): {ab_time:.4f} sec")
-
-
-#Create a 3×3 board.Evaluate board after every move.Minimax explores all possible moves recursively.
-#Alpha-Beta prunes unnecessary branches → fewer nodes visited.
-#Compare nodes visited and execution time → see efficiency gains.
-
-# ------------------ Summary Section ------------------
-improvement_nodes = ((minimax_nodes - ab_nodes) / minimax_nodes * 100) if minimax_nodes else 0
-improvement_time = ((minimax_time - ab_time) / minimax_time * 100) if minimax_time else 0
-
-print("\n===== SUMMARY")
-print(f"NODES (Space Used):")
-print(f"   Minimax expanded {minimax_nodes} nodes")
-print(f"   Alpha–Beta expanded {ab_nodes} nodes")
-print(f"   Space reduction: {improvement_nodes:.2f}% fewer nodes expanded\n")
-
-print(f"EXECUTION TIME (Speed):")
-print(f"   Minimax took {minimax_time:.4f} seconds")
-print(f"   Alpha–Beta took {ab_time:.4f} seconds")
-print(f"   Speed improvement: {improvement_time:.2f}% faster\n")
-
-print("=LAST QUESTION O/P")
-print("- Alpha–Beta pruning reduces both time and space requirements drastically.")
-print("- It achieves the same optimal result as Minimax but explores fewer nodes.")
-print("- The best-case time complexity improves from O(b^d) to O(b^(d/2)).")
-#exploring the most promising nodes first.
-print("- Node reordering (evaluating promising moves first) can further improve pruning efficiency.")
+if __name__ == "__main__":
+    # ------------------ Run and Compare ------------------
+    print("===== Minimax vs Alpha-Beta Comparison =====")
+    minimax_nodes = 0
+    ab_nodes = 0
+
+    # Minimax Test
+    print("\nPlaying with Minimax:")
+    start_time = time.time()
+    play_game(use_alpha_beta=False)
+    minimax_time = time.time() - start_time
+    print(f"Nodes visited (Minimax): {minimax_nodes}")
+    print(f"Execution time (Minimax): {minimax_time:.4f} sec")
+
+    # Alpha-Beta Test
+    print("\nPlaying with Alpha-Beta Pruning:")
+    start_time = time.time()
+    play_game(use_alpha_beta=True)
+    ab_time = time.time() - start_time
+    print(f"Nodes visited (Alpha-Beta): {ab_nodes}")
+    print(f"Execution time (Alpha-Beta): {ab_time:.4f} sec")
+
+
+    #Create a 3×3 board.Evaluate board after every move.Minimax explores all possible moves recursively.
+    #Alpha-Beta prunes unnecessary branches → fewer nodes visited.
+    #Compare nodes visited and execution time → see efficiency gains.
+
+    # ------------------ Summary Section ------------------
+    improvement_nodes = ((minimax_nodes - ab_nodes) / minimax_nodes * 100) if minimax_nodes else 0
+    improvement_time = ((minimax_time - ab_time) / minimax_time * 100) if minimax_time else 0
+
+    print("\n===== SUMMARY")
+    print(f"NODES (Space Used):")
+    print(f"   Minimax expanded {minimax_nodes} nodes")
+    print(f"   Alpha–Beta expanded {ab_nodes} nodes")
+    print(f"   Space reduction: {improvement_nodes:.2f}% fewer nodes expanded\n")
+
+    print(f"EXECUTION TIME (Speed):")
+    print(f"   Minimax took {minimax_time:.4f} seconds")
+    print(f"   Alpha–Beta took {ab_time:.4f} seconds")
+    print(f"   Speed improvement: {improvement_time:.2f}% faster\n")
+
+    print("=LAST QUESTION O/P")
+    print("- Alpha–Beta pruning reduces both time and space requirements drastically.")
+    print("- It achieves the same optimal result as Minimax but explores fewer nodes.")
+    print("- The best-case time complexity improves from O(b^d) to O(b^(d/2)).")
+    #exploring the most promising nodes first.
+    print("- Node reordering (evaluating promising moves first) can further improve pruning efficiency.")
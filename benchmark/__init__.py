@@ -0,0 +1,9 @@
+#one benchmark for all the solver scripts:
+#  python -m benchmark                         run the suite,write benchmark_results.json
+#  python -m benchmark --baseline FILE         ... and compare against a stored run
+#                                              (cases that look slower are re-run before they count)
+#  python -m benchmark --update-baseline       store this run as benchmark/baseline.json
+#every case runs with a pinned seed, a few warmup runs and several timed repeats
+from benchmark.runner import Case, load_solver, run_case, run_suite, compare, relative_speed
+
+__all__ = ["Case", "load_solver", "run_case", "run_suite", "compare", "relative_speed"]
@@ -0,0 +1,87 @@
+import argparse
+import json
+import os
+import sys
+
+from benchmark.runner import compare, relative_speed, run_case, run_suite
+from benchmark.suite import CASES
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+def print_row(name, row):
+    nodes = "-" if row["nodes"] is None else row["nodes"]
+    print(f"{name:<30} {row['wall_s'] * 1000:>11.3f} {row['cpu_s'] * 1000:>11.3f} "
+          f"{row['peak_kb']:>11.1f} {nodes:>10}  {row['result']}" + (" (known bad)" if "known_bad" in row else ""))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmark", description="Run the solver benchmark suite.")
+    parser.add_argument("--only", help="run only cases whose name contains this")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, help="timed runs per case (default: per case)")
+    parser.add_argument("--warmup", type=int, help="untimed runs before timing (default: per case)")
+    parser.add_argument("--out", default="benchmark_results.json", help="where to write this run")
+    parser.add_argument("--baseline", help="compare against this results file")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="flag a metric that got worse by more than this fraction (default 0.2)")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="re-run cases that look slower up to this many times (default 2)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help=f"also store this run in {BASELINE} (with --only: just those cases)")
+    args = parser.parse_args(argv)
+
+    print(f"{'Case':<30} {'Wall (ms)':>11} {'CPU (ms)':>11} {'Peak (KB)':>11} {'Nodes':>10}  Result")
+    print("-" * 90)
+    results = run_suite(CASES, seed=args.seed, repeats=args.repeats, warmup=args.warmup,
+                        only=args.only, report=print_row)
+
+    regressions, changes = [], []
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        #only compare the cases that were run
+        if args.only is not None:
+            baseline["cases"] = {k: v for k, v in baseline["cases"].items() if args.only in k}
+        regressions, changes = compare(results, baseline, args.threshold)
+        #a burst of load can slow every repeat of one case: run the cases that look slower again,
+        #keep their faster run and only report what stays slow
+        for _ in range(args.retries):
+            suspects = sorted({name for name, metric, old, new in regressions if metric.endswith("_s")})
+            if not suspects:
+                break
+            print(f"\nRe-running {len(suspects)} case(s) that look slower:")
+            for case in CASES:
+                if case.name in suspects:
+                    row = run_case(case, args.seed, args.repeats, args.warmup)
+                    print_row(case.name, row)
+                    if relative_speed(row) < relative_speed(results["cases"][case.name]):
+                        results["cases"][case.name] = row
+            regressions, changes = compare(results, baseline, args.threshold)
+
+    #sorted keys + indent -> a plain text diff between two runs is readable
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(f"\nResults written to {args.out}")
+    if args.update_baseline:
+        stored = results
+        #a partial run replaces only its own cases,the others keep their stored numbers
+        if args.only is not None and os.path.exists(BASELINE):
+            with open(BASELINE) as f:
+                stored = json.load(f)
+            stored["environment"] = results["environment"]
+            stored["cases"].update(results["cases"])
+        with open(BASELINE, "w") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+        print(f"Baseline updated: {BASELINE}")
+
+    if args.baseline is None:
+        return 0
+    for name, note in changes:
+        print(f"CHANGED    {name}: {note}")
+    for name, metric, old, new in regressions:
+        print(f"REGRESSION {name}: {metric} {old:.6g} -> {new:.6g} (+{(new / old - 1) * 100:.1f}%, speed adjusted)")
+    if not regressions:
+        print(f"No regressions above {args.threshold * 100:.0f}% against {args.baseline}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
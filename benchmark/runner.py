@@ -0,0 +1,183 @@
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+#the solver scripts live one level up and have spaces in their names,so they are loaded by path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOLVERS = {
+    "bfs": "1   8x8 puzzle using BFS.py",
+    "graph": "2   DFS,BFS,UCS&IDSonweightedgraph.py",
+    "informed": "3   8puzzle using A* , RBFS.py",
+    "local": "4   Random Restart Hill Climbing using TSP,8 queens,8x8 puzzle.py",
+    "coloring": "5   MapColoring using CSP.py",
+    "sudoku": "6   9x9SudokoPuzzleBackJumpingWith&WithoutHeuristics.py",
+    "minimax": "8   TicTacToeUsingMinimaxAlphaBetaPruningAlgorithm.py",
+}
+loaded = {}
+
+def load_solver(key):
+    if key not in loaded:
+        name = f"solver_{key}"
+        spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, SOLVERS[key]))
+        module = importlib.util.module_from_spec(spec)
+        #registered like a normal import,so process pools can pickle the solver's functions
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        loaded[key] = module
+    return loaded[key]
+
+#setup(seed) -> run,a function without arguments that does the measured work and returns
+#{"nodes": nodes expanded or None, "result": something small to check the answer (cost, path length)}
+#setup is not timed and is called again before every run,so runs never share state
+#known_bad: why the solver gets this case wrong; it still runs and is timed,but its result is not an
+#expected answer,so compare() never reports it as changed
+class Case:
+    def __init__(self, name, setup, repeats=5, warmup=1, known_bad=None):
+        self.name = name
+        self.setup = setup
+        self.repeats = repeats
+        self.warmup = warmup
+        self.known_bad = known_bad
+
+def seed_everything(seed):
+    random.seed(seed)
+    np.random.seed(seed)
+
+#a fixed bit of pure python (like the solvers) timed right before every case,fastest of a few tries.
+#When the whole machine is slower for a while (other load,frequency scaling) this slows down by the
+#same factor,so compare() can take that out instead of flagging every case
+def calibrate(rounds=5):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        total = 0
+        for i in range(100000):
+            total += i * i % 7
+        best = min(best, time.perf_counter() - start)
+    return best
+
+#one measured call: (wall seconds, cpu seconds, outcome)
+#the solvers' own prints are swallowed so they don't end up in the timings or the report
+def measure(case, seed):
+    seed_everything(seed)
+    run = case.setup(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        wall, cpu = time.perf_counter(), time.process_time()
+        outcome = run()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return wall, cpu, outcome
+
+#tracemalloc slows everything down a lot,so peak memory comes from one extra traced run
+def measure_peak(case, seed):
+    seed_everything(seed)
+    run = case.setup(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        try:
+            run()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return peak
+
+def run_case(case, seed=0, repeats=None, warmup=None):
+    repeats = case.repeats if repeats is None else repeats
+    warmup = case.warmup if warmup is None else warmup
+    for _ in range(warmup):
+        measure(case, seed)
+    calibration = calibrate()
+    walls, cpus, outcomes = [], [], []
+    for _ in range(repeats):
+        wall, cpu, outcome = measure(case, seed)
+        walls.append(wall)
+        cpus.append(cpu)
+        outcomes.append(outcome)
+    #same seed -> same answer every time,anything else is a bug in the case or the solver
+    if any(o != outcomes[0] for o in outcomes):
+        raise RuntimeError(f"{case.name}: repeats with the same seed gave different results")
+    row = {
+        "wall_s": statistics.median(walls),
+        "wall_min_s": min(walls),
+        "cpu_s": statistics.median(cpus),
+        "cpu_min_s": min(cpus),
+        "calibration_s": calibration,
+        "peak_kb": round(measure_peak(case, seed) / 1024, 1),
+        "nodes": outcomes[0].get("nodes"),
+        #through json once,so a fresh run compares equal to one read back from a file
+        "result": json.loads(json.dumps(outcomes[0].get("result"))),
+        "repeats": repeats,
+    }
+    if case.known_bad is not None:
+        row["known_bad"] = case.known_bad
+    return row
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "numpy": np.__version__,
+    }
+
+#runs every case whose name contains `only` (all of them by default),report(name, row) after each one
+def run_suite(cases, seed=0, repeats=None, warmup=None, only=None, report=None):
+    results = {}
+    for case in cases:
+        if only is not None and only not in case.name:
+            continue
+        results[case.name] = run_case(case, seed, repeats, warmup)
+        if report is not None:
+            report(case.name, results[case.name])
+    return {"environment": environment(),
+            "settings": {"seed": seed, "repeats": repeats, "warmup": warmup},
+            "cases": results}
+
+#metrics where bigger is worse; times below `floor` seconds apart are treated as noise
+#times are compared on the fastest repeat,other processes on the machine only ever make a run slower
+#(the median of 3 repeats moved by 30%+ between two runs of the same code),
+#and rescaled by the two calibration times when both rows have one
+METRICS = ("wall_min_s", "cpu_min_s", "peak_kb", "nodes")
+
+#wall time of a row in units of its calibration run: lower = faster,comparable across machine slowdowns
+def relative_speed(row):
+    return row["wall_min_s"] / row["calibration_s"] if row.get("calibration_s") else row["wall_min_s"]
+
+def compare(current, baseline, threshold=0.2, floor=1e-3):
+    #returns (regressions, changes): regressions are (case, metric, old, new) that got more than
+    #threshold worse, changes are cases whose nodes/result differ or that exist on one side only
+    regressions, changes = [], []
+    old_cases, new_cases = baseline["cases"], current["cases"]
+    for name in sorted(set(old_cases) | set(new_cases)):
+        if name not in old_cases or name not in new_cases:
+            changes.append((name, "missing in baseline" if name not in old_cases else "missing in this run"))
+            continue
+        old, new = old_cases[name], new_cases[name]
+        for metric in METRICS:
+            a, b = old.get(metric), new.get(metric)
+            if a is None or b is None:
+                continue
+            if metric.endswith("_s") and old.get("calibration_s") and new.get("calibration_s"):
+                b = b * old["calibration_s"] / new["calibration_s"]
+            if metric.endswith("_s") and b - a < floor:
+                continue
+            if b > a * (1 + threshold):
+                regressions.append((name, metric, a, b))
+        #a wrong answer is not a baseline to hold on to
+        if "known_bad" in old or "known_bad" in new:
+            continue
+        if old.get("result") != new.get("result"):
+            changes.append((name, f"result {old.get('result')} -> {new.get('result')}"))
+        if old.get("nodes") != new.get("nodes"):
+            changes.append((name, f"nodes {old.get('nodes')} -> {new.get('nodes')}"))
+    return regressions, changes
@@ -0,0 +1,167 @@
+import random
+
+import numpy as np
+
+from benchmark.runner import Case, load_solver
+
+#the instances are fixed here,only their random parts are drawn from the seed
+#8 puzzle start 14 moves away from the goal
+PUZZLE = [[8, 1, 3], [4, 0, 2], [7, 6, 5]]
+SUDOKU = [
+    [5, 3, 0, 0, 7, 0, 0, 0, 0],
+    [6, 0, 0, 1, 9, 5, 0, 0, 0],
+    [0, 9, 8, 0, 0, 0, 0, 6, 0],
+    [8, 0, 0, 0, 6, 0, 0, 0, 3],
+    [4, 0, 0, 8, 0, 3, 0, 0, 1],
+    [7, 0, 0, 0, 2, 0, 0, 0, 6],
+    [0, 6, 0, 0, 0, 0, 2, 8, 0],
+    [0, 0, 0, 4, 1, 9, 0, 0, 5],
+    [0, 0, 0, 0, 8, 0, 0, 7, 9],
+]
+
+# ---------------- 8 puzzle ----------------
+def puzzle_bfs(bidirectional):
+    def setup(seed):
+        bfs = load_solver("bfs")
+        code = bfs.encodeBoard(PUZZLE)
+        search = bfs.bfsBidirectional if bidirectional else bfs.bfsPacked
+        return lambda: {"nodes": None, "result": len(search(code))}
+    return setup
+
+def puzzle_informed(name):
+    def setup(seed):
+        informed = load_solver("informed")
+        def run():
+            if name == "astar":
+                path, stats = informed.astar(PUZZLE)
+            elif name == "idastar":
+                path, stats = informed.ida_star(PUZZLE)
+            else:
+                path, stats = informed.sma_star(PUZZLE, max_nodes=1000)
+            return {"nodes": stats["expanded"], "result": len(path) - 1}
+        return run
+    return setup
+
+# ---------------- weighted graph search ----------------
+#one connected random graph and 20 source/destination pairs,all from the seed
+def graph_search(name):
+    def setup(seed):
+        graph = load_solver("graph")
+        G = graph.generate_connected_csr(2000, edge_prob=0.005, seed=seed)
+        rng = random.Random(seed)
+        pairs = [rng.sample(range(2000), 2) for _ in range(20)]
+        def run():
+            nodes = 0
+            total = 0
+            for src, dest in pairs:
+                searched, cost = graph.run_search(name, G, None, src, dest)
+                nodes += searched
+                total += cost or 0
+            return {"nodes": nodes, "result": total}
+        return run
+    return setup
+
+# ---------------- local search ----------------
+def tsp_restarts(seed):
+    local = load_solver("local")
+    problem = local.TSP([f"C{i}" for i in range(100)])
+    def run():
+        tour, cost = local.random_restart_hill_climb(problem, restarts=3, max_steps=10000,
+                                                     strategy="first", seed=seed)
+        return {"nodes": None, "result": cost}
+    return run
+
+def tsp_candidates(seed):
+    local = load_solver("local")
+    coords = np.random.default_rng(seed).uniform(0, 1000, (2000, 2))
+    problem = local.TSP([f"C{i}" for i in range(2000)], coords=coords, metric="EUC_2D")
+    problem.neighbor_lists()
+    def run():
+        tour, cost = local.random_restart_hill_climb(problem, restarts=1, max_steps=10**6,
+                                                     seed=seed, neighborhood="candidates")
+        return {"nodes": None, "result": cost}
+    return run
+
+def tsp_annealing(seed):
+    local = load_solver("local")
+    problem = local.TSP([f"C{i}" for i in range(100)])
+    def run():
+        tour, cost = local.simulated_annealing(problem, max_evals=50000, seed=seed)
+        return {"nodes": None, "result": cost}
+    return run
+
+def queens_min_conflicts(seed):
+    local = load_solver("local")
+    problem = local.NQueens(50000)
+    def run():
+        board, cost = local.min_conflicts(problem, rng=random.Random(seed))
+        return {"nodes": None, "result": cost}
+    return run
+
+# ---------------- constraint satisfaction ----------------
+def map_coloring(rows, cols, strategy="backtracking", colors=4, decompose=False):
+    def setup(seed):
+        coloring = load_solver("coloring")
+        graph = coloring.generate_planar_graph(rows, cols)
+        def run():
+            solution = coloring.solve_map_coloring(graph, colors, timeout=10, strategy=strategy,
+                                                   rng=random.Random(seed), decompose=decompose)
+            return {"nodes": None, "result": solution is not None}
+        return run
+    return setup
+
+def sudoku(solver):
+    def setup(seed):
+        module = load_solver("sudoku")
+        board = [row[:] for row in SUDOKU]
+        def run():
+            s = getattr(module, solver)(board)
+            solved = s.solve()
+            return {"nodes": s.steps, "result": bool(solved)}
+        return run
+    return setup
+
+# ---------------- game search ----------------
+#best move for X: alpha-beta from the empty board,plain minimax after X centre / O corner (the full tree is too slow)
+def tictactoe(alpha_beta):
+    def setup(seed):
+        game = load_solver("minimax")
+        board = [[' '] * 3 for _ in range(3)]
+        if not alpha_beta:
+            board[1][1] = 'X'
+            board[0][0] = 'O'
+        def run():
+            game.minimax_nodes = 0
+            game.ab_nodes = 0
+            move = game.find_best_move_ab(board) if alpha_beta else game.find_best_move(board)
+            nodes = game.ab_nodes if alpha_beta else game.minimax_nodes
+            return {"nodes": nodes, "result": list(move)}
+        return run
+    return setup
+
+CASES = [
+    Case("8puzzle/bfs", puzzle_bfs(False)),
+    Case("8puzzle/bfs-bidirectional", puzzle_bfs(True)),
+    Case("8puzzle/astar", puzzle_informed("astar")),
+    Case("8puzzle/idastar", puzzle_informed("idastar")),
+    Case("8puzzle/smastar", puzzle_informed("smastar")),
+    Case("graph/bfs", graph_search("BFS")),
+    Case("graph/ucs", graph_search("UCS")),
+    Case("graph/bidirectional-dijkstra", graph_search("BiDijkstra")),
+    Case("graph/ids", graph_search("IDS"), repeats=3),
+    Case("tsp/restarts-2opt", tsp_restarts, repeats=3),
+    Case("tsp/candidates-2000", tsp_candidates, repeats=3),
+    Case("tsp/annealing", tsp_annealing, repeats=3),
+    Case("queens/min-conflicts-50000", queens_min_conflicts, repeats=3),
+    Case("coloring/backtracking-10x10", map_coloring(10, 10)),
+    Case("coloring/dsatur-316x316", map_coloring(316, 316, "dsatur"), repeats=3),
+    Case("coloring/cbj-100x100-3colors", map_coloring(100, 100, "cbj", colors=3), repeats=3),
+    Case("coloring/decomposed-316x316", map_coloring(316, 316, decompose=True), repeats=3),
+    Case("sudoku/backtracking", sudoku("SimpleBacktracking")),
+    Case("sudoku/mrv", sudoku("HeuristicBacktracking")),
+    Case("sudoku/backjumping", sudoku("Backjumping"),
+         known_bad="Backjumping gives up on this solvable puzzle (it jumps on conflict sets it never fills in)"),
+    Case("sudoku/backjumping-mrv", sudoku("BackjumpingHeuristic")),
+    Case("tictactoe/minimax", tictactoe(False), repeats=3),
+    Case("tictactoe/alphabeta", tictactoe(True), repeats=3),
+]
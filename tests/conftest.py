@@ -0,0 +1,5 @@
+import os
+import sys
+
+#the tests load the solver scripts through the benchmark package,which lives in the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
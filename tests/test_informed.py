@@ -0,0 +1,27 @@
+import random
+
+from benchmark.runner import load_solver
+
+#solvable random 8 puzzles
+def random_boards(count, seed=0):
+    informed = load_solver("informed")
+    rng = random.Random(seed)
+    boards = []
+    while len(boards) < count:
+        tiles = list(range(9))
+        rng.shuffle(tiles)
+        board = [tiles[i*3:i*3+3] for i in range(3)]
+        if informed.is_solvable(board):
+            boards.append(board)
+    return boards
+
+#IDA* stays optimal with any admissible heuristic,so its path length is the reference
+def test_astar_with_pdb_is_optimal():
+    informed = load_solver("informed")
+    pdb = informed.PatternDatabase.build(3, [(1, 2, 3, 4), (5, 6, 7, 8)])
+    #the PDB is inconsistent here,A* without reopening returned 25 moves
+    boards = [[[6, 3, 7], [0, 1, 2], [4, 8, 5]]] + random_boards(200)
+    for board in boards:
+        path, stats = informed.astar(board, heuristic=pdb)
+        expected, _ = informed.ida_star(board)
+        assert len(path) == len(expected), board